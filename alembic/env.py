@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from alembic import context
 
-from community_scout.config import settings
+from community_scout.config import get_settings
 from community_scout.models import Base
 
 # this is the Alembic Config object, which provides
@@ -17,7 +17,7 @@ from community_scout.models import Base
 config = context.config
 
 # Set the database URL from settings
-config.set_main_option("sqlalchemy.url", settings.database_url)
+config.set_main_option("sqlalchemy.url", get_settings().database_url)
 
 # Interpret the config file for Python logging.
 if config.config_file_name is not None:
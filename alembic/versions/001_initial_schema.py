@@ -38,7 +38,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("discord_id"),
     )
-    op.create_index("ix_discord_users_discord_id", "discord_users", ["discord_id"])
 
     # Create content_sources table
     op.create_table(
@@ -71,7 +70,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.ForeignKeyConstraint(["user_id"], ["discord_users.id"], ondelete="CASCADE"),
     )
-    op.create_index("ix_user_keywords_user_id", "user_keywords", ["user_id"])
 
     # Create source_threads table
     op.create_table(
@@ -90,7 +88,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["user_id"], ["discord_users.id"], ondelete="CASCADE"),
         sa.ForeignKeyConstraint(["source_id"], ["content_sources.id"], ondelete="CASCADE"),
     )
-    op.create_index("ix_source_threads_user_id", "source_threads", ["user_id"])
 
     # Create hn_items table
     op.create_table(
@@ -114,7 +111,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("hn_id"),
     )
-    op.create_index("ix_hn_items_hn_id", "hn_items", ["hn_id"])
 
     # Create user_alerts table
     op.create_table(
@@ -139,6 +135,12 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(["keyword_id"], ["user_keywords.id"], ondelete="CASCADE"),
         sa.ForeignKeyConstraint(["source_id"], ["content_sources.id"], ondelete="CASCADE"),
     )
+
+    # Create indexes once all tables exist
+    op.create_index("ix_discord_users_discord_id", "discord_users", ["discord_id"])
+    op.create_index("ix_user_keywords_user_id", "user_keywords", ["user_id"])
+    op.create_index("ix_source_threads_user_id", "source_threads", ["user_id"])
+    op.create_index("ix_hn_items_hn_id", "hn_items", ["hn_id"])
     op.create_index("ix_user_alerts_user_id", "user_alerts", ["user_id"])
     op.create_index("ix_user_alerts_status", "user_alerts", ["status"])
 
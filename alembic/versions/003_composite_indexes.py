@@ -0,0 +1,65 @@
+"""Replace single-column user_alerts/source_threads indexes with composites.
+
+Revision ID: 003_composite_indexes
+Revises: 002_scanner_state
+Create Date: 2026-10-16
+
+Indexes are built with CONCURRENTLY so existing tables stay writable,
+which requires running outside the migration transaction.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "003_composite_indexes"
+down_revision: str | None = "002_scanner_state"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_alerts_user_status_created",
+            "user_alerts",
+            ["user_id", "status", sa.text("created_at DESC")],
+            postgresql_include=["item_id", "keyword_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_source_threads_user_source",
+            "source_threads",
+            ["user_id", "source_id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_user_alerts_user_id", "user_alerts", postgresql_concurrently=True)
+        op.drop_index("ix_user_alerts_status", "user_alerts", postgresql_concurrently=True)
+        op.drop_index(
+            "ix_source_threads_user_id", "source_threads", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_source_threads_user_id",
+            "source_threads",
+            ["user_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_user_alerts_status", "user_alerts", ["status"], postgresql_concurrently=True
+        )
+        op.create_index(
+            "ix_user_alerts_user_id", "user_alerts", ["user_id"], postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_source_threads_user_source", "source_threads", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_user_alerts_user_status_created", "user_alerts", postgresql_concurrently=True
+        )
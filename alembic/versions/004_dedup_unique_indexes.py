@@ -0,0 +1,58 @@
+"""Add unique indexes used for ON CONFLICT deduplication.
+
+Revision ID: 004_dedup_unique_indexes
+Revises: 003_composite_indexes
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "004_dedup_unique_indexes"
+down_revision: str | None = "003_composite_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Remove any duplicates that slipped past the application-level checks
+    op.execute(
+        """
+        DELETE FROM user_alerts a
+        USING user_alerts b
+        WHERE a.user_id = b.user_id
+          AND a.item_id = b.item_id
+          AND a.keyword_id = b.keyword_id
+          AND a.id > b.id
+        """
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_source_threads_source_thread_unique",
+            "source_threads",
+            ["source_id", "thread_id"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_user_alerts_dedup",
+            "user_alerts",
+            ["user_id", "item_id", "keyword_id"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_user_alerts_dedup", "user_alerts", postgresql_concurrently=True)
+        op.drop_index(
+            "ix_source_threads_source_thread_unique",
+            "source_threads",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,41 @@
+"""Drop indexes duplicated by unique constraints.
+
+Revision ID: 005_drop_redundant_indexes
+Revises: 004_dedup_unique_indexes
+Create Date: 2026-10-16
+
+hn_items.hn_id and discord_users.discord_id already have a unique
+constraint, whose backing index serves equality lookups.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "005_drop_redundant_indexes"
+down_revision: str | None = "004_dedup_unique_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_hn_items_hn_id", "hn_items", postgresql_concurrently=True)
+        op.drop_index(
+            "ix_discord_users_discord_id", "discord_users", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_discord_users_discord_id",
+            "discord_users",
+            ["discord_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_hn_items_hn_id", "hn_items", ["hn_id"], postgresql_concurrently=True
+        )
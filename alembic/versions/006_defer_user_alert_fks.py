@@ -0,0 +1,39 @@
+"""Make user_alerts foreign keys deferrable.
+
+Revision ID: 006_defer_user_alert_fks
+Revises: 005_drop_redundant_indexes
+Create Date: 2026-10-16
+
+FK checks on the write-hot user_alerts table run once at commit instead of
+per inserted row. ALTER CONSTRAINT only changes the deferral mode, so the
+existing constraints do not need to be revalidated.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "006_defer_user_alert_fks"
+down_revision: str | None = "005_drop_redundant_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Postgres default names for the constraints created in 001_initial
+USER_ALERT_FKS = (
+    "user_alerts_user_id_fkey",
+    "user_alerts_item_id_fkey",
+    "user_alerts_keyword_id_fkey",
+    "user_alerts_source_id_fkey",
+)
+
+
+def upgrade() -> None:
+    for name in USER_ALERT_FKS:
+        op.execute(f"ALTER TABLE user_alerts ALTER CONSTRAINT {name} DEFERRABLE INITIALLY DEFERRED")
+
+
+def downgrade() -> None:
+    for name in USER_ALERT_FKS:
+        op.execute(f"ALTER TABLE user_alerts ALTER CONSTRAINT {name} NOT DEFERRABLE")
@@ -0,0 +1,38 @@
+"""Add a partial index over pending user_alerts.
+
+Revision ID: 007_pending_alerts_partial_index
+Revises: 006_defer_user_alert_fks
+Create Date: 2026-10-16
+
+The notifier only ever polls status = 'pending', which is a small fraction
+of user_alerts. A partial index covers just those rows, so it stays small
+and delivered/dismissed alerts never touch it on write.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "007_pending_alerts_partial_index"
+down_revision: str | None = "006_defer_user_alert_fks"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_alerts_pending",
+            "user_alerts",
+            ["user_id", "created_at"],
+            postgresql_where=sa.text("status = 'pending'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_user_alerts_pending", "user_alerts", postgresql_concurrently=True)
@@ -0,0 +1,35 @@
+"""Add bot_state table.
+
+Revision ID: 008_bot_state
+Revises: 007_pending_alerts_partial_index
+Create Date: 2026-10-16
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "008_bot_state"
+down_revision: str | None = "007_pending_alerts_partial_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bot_state",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("key", sa.String(100), nullable=False),
+        sa.Column("value", sa.Text(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("bot_state")
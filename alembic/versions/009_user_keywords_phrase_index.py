@@ -0,0 +1,48 @@
+"""Index user_keywords for case-insensitive phrase lookups.
+
+Revision ID: 009_user_keywords_phrase_index
+Revises: 008_bot_state
+Create Date: 2026-10-16
+
+Replaces ix_user_keywords_user_id with (user_id, is_active, lower(phrase)),
+which serves the same user_id lookups plus the duplicate check in
+/keyword add and the match in /keyword remove.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "009_user_keywords_phrase_index"
+down_revision: str | None = "008_bot_state"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_keywords_user_active_phrase",
+            "user_keywords",
+            ["user_id", "is_active", sa.text("lower(phrase)")],
+            postgresql_concurrently=True,
+        )
+        op.drop_index("ix_user_keywords_user_id", "user_keywords", postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_keywords_user_id",
+            "user_keywords",
+            ["user_id"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_user_keywords_user_active_phrase",
+            "user_keywords",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,43 @@
+"""Store hn_items.created_utc as Unix epoch seconds.
+
+Revision ID: 010_hn_items_epoch_created_utc
+Revises: 009_user_keywords_phrase_index
+Create Date: 2026-10-16
+
+The HN API already returns item times as epoch seconds, so storing them as
+BIGINT skips the datetime round-trip on every insert and select.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "010_hn_items_epoch_created_utc"
+down_revision: str | None = "009_user_keywords_phrase_index"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        "hn_items",
+        "created_utc",
+        type_=sa.BigInteger(),
+        existing_type=sa.DateTime(timezone=True),
+        existing_nullable=False,
+        postgresql_using="extract(epoch from created_utc)::bigint",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        "hn_items",
+        "created_utc",
+        type_=sa.DateTime(timezone=True),
+        existing_type=sa.BigInteger(),
+        existing_nullable=False,
+        postgresql_using="to_timestamp(created_utc)",
+    )
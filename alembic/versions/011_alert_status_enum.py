@@ -0,0 +1,65 @@
+"""Store user_alerts.status as a native enum.
+
+Revision ID: 011_alert_status_enum
+Revises: 010_hn_items_epoch_created_utc
+Create Date: 2026-10-16
+
+An enum value is 4 bytes instead of a varchar, which also shrinks the
+status indexes. The pending partial index is rebuilt so its predicate
+compares enum values rather than a text cast.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "011_alert_status_enum"
+down_revision: str | None = "010_hn_items_epoch_created_utc"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+alert_status = sa.Enum("pending", "sent", "dismissed", name="alert_status")
+
+
+def _create_pending_index() -> None:
+    op.create_index(
+        "ix_user_alerts_pending",
+        "user_alerts",
+        ["user_id", "created_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def upgrade() -> None:
+    alert_status.create(op.get_bind())
+    op.drop_index("ix_user_alerts_pending", "user_alerts")
+    op.alter_column("user_alerts", "status", server_default=None)
+    op.alter_column(
+        "user_alerts",
+        "status",
+        type_=alert_status,
+        existing_type=sa.String(50),
+        existing_nullable=False,
+        postgresql_using="status::alert_status",
+    )
+    op.alter_column("user_alerts", "status", server_default=sa.text("'pending'"))
+    _create_pending_index()
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_alerts_pending", "user_alerts")
+    op.alter_column("user_alerts", "status", server_default=None)
+    op.alter_column(
+        "user_alerts",
+        "status",
+        type_=sa.String(50),
+        existing_type=alert_status,
+        existing_nullable=False,
+        postgresql_using="status::text",
+    )
+    op.alter_column("user_alerts", "status", server_default=sa.text("'pending'"))
+    _create_pending_index()
+    alert_status.drop(op.get_bind())
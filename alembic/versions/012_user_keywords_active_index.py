@@ -0,0 +1,43 @@
+"""Add a covering partial index over active user_keywords.
+
+Revision ID: 012_user_keywords_active_index
+Revises: 011_alert_status_enum
+Create Date: 2026-10-16
+
+The scanner checks count(*) and max(id) of the active keywords on every
+scan and reloads (phrase, id, user_id) when they change. A partial index
+on id including those columns answers all of it with index-only scans.
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "012_user_keywords_active_index"
+down_revision: str | None = "011_alert_status_enum"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_user_keywords_active",
+            "user_keywords",
+            ["id"],
+            postgresql_include=["phrase", "user_id"],
+            postgresql_where=sa.text("is_active"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_user_keywords_active",
+            "user_keywords",
+            postgresql_concurrently=True,
+        )
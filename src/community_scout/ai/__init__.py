@@ -7,6 +7,8 @@ from community_scout.ai.client import (
     OpenRouterClient,
     OpenRouterError,
     OpenRouterRateLimitError,
+    OpenRouterServerError,
+    close_shared_client,
 )
 
 __all__ = [
@@ -16,4 +18,6 @@ __all__ = [
     "OpenRouterAuthError",
     "OpenRouterError",
     "OpenRouterRateLimitError",
+    "OpenRouterServerError",
+    "close_shared_client",
 ]
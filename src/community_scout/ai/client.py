@@ -1,16 +1,99 @@
 """OpenRouter API client wrapper."""
 
+import asyncio
+import hashlib
 import logging
+import random
+import time
 from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 
 import httpx
+from cachetools import TTLCache
 
-from community_scout.config import settings
+from community_scout.config import get_settings
+from community_scout.serialization import dumps, loads
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+DEFAULT_TIMEOUT = 60.0
+
+# Shared across OpenRouterClient instances so summaries reuse warm HTTP/2
+# connections; auth headers are sent per request since keys differ per user
+_shared_client: httpx.AsyncClient | None = None
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            timeout=DEFAULT_TIMEOUT,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _shared_client
+
+
+class RateLimiter:
+    """Token bucket limiting requests per minute, shared by concurrent callers."""
+
+    def __init__(self, requests_per_minute: int) -> None:
+        self.capacity = float(requests_per_minute)
+        self._refill_per_second = requests_per_minute / 60
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        # Waiters queue up in order instead of all polling the bucket
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self._refill_per_second
+            )
+            self._updated = now
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self._refill_per_second)
+                self._tokens = 1.0
+                self._updated = time.monotonic()
+            self._tokens -= 1
+
+
+# SHA-256 of API key -> limiter, so every client for a key draws from one budget.
+# Idle limiters expire; a fresh one starts with at most a minute's worth of tokens.
+RATE_LIMITER_CACHE_SIZE = 1024
+RATE_LIMITER_TTL_SECONDS = 10 * 60
+_rate_limiters: TTLCache[bytes, RateLimiter] = TTLCache(
+    maxsize=RATE_LIMITER_CACHE_SIZE, ttl=RATE_LIMITER_TTL_SECONDS
+)
+
+
+def _get_rate_limiter(api_key: str) -> RateLimiter | None:
+    """Get the request limiter for an API key, or None if limiting is off."""
+    requests_per_minute = get_settings().openrouter_requests_per_minute
+    if requests_per_minute <= 0:
+        return None
+    key = hashlib.sha256(api_key.encode()).digest()
+    limiter = _rate_limiters.get(key)
+    if limiter is None:
+        limiter = RateLimiter(requests_per_minute)
+    # Re-inserting refreshes the TTL, so only idle limiters expire
+    _rate_limiters[key] = limiter
+    return limiter
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client, e.g. on shutdown."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+@dataclass(slots=True, frozen=True)
 class ChatMessage:
     """Represents a chat message."""
 
@@ -18,7 +101,7 @@ class ChatMessage:
     content: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ChatCompletion:
     """Represents a chat completion response."""
 
@@ -41,20 +124,47 @@ class OpenRouterAuthError(OpenRouterError):
     pass
 
 
+class OpenRouterServerError(OpenRouterError):
+    """Transient server-side error (5xx) that is worth retrying."""
+
+    pass
+
+
 class OpenRouterRateLimitError(OpenRouterError):
     """Rate limit error."""
 
-    def __init__(self, message: str, retry_after: int | None = None):
+    def __init__(self, message: str, retry_after: float | None = None):
         super().__init__(message)
         self.retry_after = retry_after
 
 
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as seconds or as an HTTP date.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
 class OpenRouterClient:
     """Client for OpenRouter API."""
 
     MAX_RETRIES = 3
     RETRY_DELAY_SECONDS = 2
-    DEFAULT_TIMEOUT = 60.0
+    MAX_RETRY_DELAY_SECONDS = 30
 
     def __init__(
         self,
@@ -70,9 +180,13 @@ class OpenRouterClient:
             model: Model to use (defaults to settings)
             base_url: API base URL (defaults to settings)
         """
+        settings = get_settings()
         self.api_key = api_key or settings.openrouter_api_key
         self.model = model or settings.openrouter_model
         self.base_url = base_url or settings.openrouter_base_url
+        # Overrides the shared HTTP client when set (e.g. in tests)
+        self._client: httpx.AsyncClient | None = None
+        self._rate_limiter = _get_rate_limiter(self.api_key) if self.api_key else None
 
         if not self.api_key:
             raise OpenRouterAuthError(
@@ -80,15 +194,60 @@ class OpenRouterClient:
                 "Set OPENROUTER_API_KEY environment variable."
             )
 
-    def _get_headers(self) -> dict[str, str]:
-        """Get request headers."""
-        return {
+        # Request headers never change for a given key, so build them once
+        self._headers: dict[str, str] = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
             "HTTP-Referer": "https://community-scout.app",  # Required by OpenRouter
             "X-Title": "Community Scout",  # For OpenRouter dashboard
         }
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the HTTP client for requests.
+
+        This is the process-wide client, so connections (and their TLS
+        sessions) outlive this instance and are reused by the next one.
+        Call close_shared_client() on shutdown.
+        """
+        if self._client is not None:
+            return self._client
+        return _get_shared_client()
+
+    async def aclose(self) -> None:
+        """Close an HTTP client set on this instance; the shared one stays open."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "OpenRouterClient":
+        """Enter async context."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Exit async context."""
+        await self.aclose()
+
+    @staticmethod
+    def _should_retry(status_code: int) -> bool:
+        """Check whether a failed response status is worth retrying.
+
+        Rate limits and server errors are transient; other client errors
+        (bad request, unknown model, etc.) will not succeed on retry.
+        """
+        return status_code == 429 or status_code >= 500
+
+    def _next_delay(self, previous: float) -> float:
+        """Compute the next retry delay using decorrelated jitter.
+
+        Spreads out retries from concurrent callers instead of having them
+        all wake up at the same moment.
+        """
+        return min(
+            self.MAX_RETRY_DELAY_SECONDS,
+            random.uniform(self.RETRY_DELAY_SECONDS, previous * 3),
+        )
+
     async def chat(
         self,
         messages: list[ChatMessage],
@@ -119,71 +278,70 @@ class OpenRouterClient:
             "messages": [{"role": m.role, "content": m.content} for m in messages],
             "temperature": temperature,
             "max_tokens": max_tokens,
+            "stream": True,
         }
+        # Serialize once; retries resend the same body
+        body = dumps(payload)
 
         last_error: Exception | None = None
+        delay = float(self.RETRY_DELAY_SECONDS)
 
         for attempt in range(self.MAX_RETRIES):
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire()
             try:
-                async with httpx.AsyncClient(timeout=self.DEFAULT_TIMEOUT) as client:
-                    response = await client.post(
-                        url,
-                        headers=self._get_headers(),
-                        json=payload,
-                    )
-
+                async with self.client.stream(
+                    "POST", url, content=body, headers=self._headers
+                ) as response:
                     if response.status_code == 401:
                         raise OpenRouterAuthError("Invalid API key")
 
                     if response.status_code == 429:
-                        retry_after = response.headers.get("Retry-After")
-                        retry_seconds = int(retry_after) if retry_after else None
                         raise OpenRouterRateLimitError(
-                            "Rate limited by OpenRouter", retry_after=retry_seconds
+                            "Rate limited by OpenRouter",
+                            retry_after=parse_retry_after(response.headers.get("Retry-After")),
                         )
 
                     if response.status_code >= 400:
-                        error_detail = response.text
-                        raise OpenRouterError(
-                            f"OpenRouter API error ({response.status_code}): {error_detail}"
-                        )
-
-                    data = response.json()
-
-                    # Extract response content
-                    choices = data.get("choices", [])
-                    if not choices:
-                        raise OpenRouterError("No choices in response")
+                        error_detail = (await response.aread()).decode(errors="replace")
+                        message = f"OpenRouter API error ({response.status_code}): {error_detail}"
+                        if self._should_retry(response.status_code):
+                            raise OpenRouterServerError(message)
+                        # Other 4xx errors will fail the same way on every attempt
+                        raise OpenRouterError(message)
 
-                    content = choices[0].get("message", {}).get("content", "")
-                    usage = data.get("usage", {})
-
-                    return ChatCompletion(
-                        content=content,
-                        model=data.get("model", model),
-                        prompt_tokens=usage.get("prompt_tokens", 0),
-                        completion_tokens=usage.get("completion_tokens", 0),
-                        total_tokens=usage.get("total_tokens", 0),
-                    )
+                    return await self._read_stream(response, model)
 
             except OpenRouterAuthError:
                 # Don't retry auth errors
                 raise
             except OpenRouterRateLimitError as e:
                 if attempt < self.MAX_RETRIES - 1:
-                    wait_time = e.retry_after or (self.RETRY_DELAY_SECONDS * (attempt + 1))
+                    delay = self._next_delay(delay)
+                    wait_time = e.retry_after if e.retry_after is not None else delay
                     logger.warning(
-                        "Rate limited (attempt %d/%d). Waiting %d seconds...",
+                        "Rate limited (attempt %d/%d). Waiting %.1f seconds...",
                         attempt + 1,
                         self.MAX_RETRIES,
                         wait_time,
                     )
-                    import asyncio
-
                     await asyncio.sleep(wait_time)
                     last_error = e
                 else:
                     raise
+            except OpenRouterServerError as e:
+                if attempt < self.MAX_RETRIES - 1:
+                    logger.warning(
+                        "Server error (attempt %d/%d): %s. Retrying...",
+                        attempt + 1,
+                        self.MAX_RETRIES,
+                        str(e),
+                    )
+                    delay = self._next_delay(delay)
+                    await asyncio.sleep(delay)
+                    last_error = e
+                else:
+                    raise
             except httpx.TimeoutException as e:
                 if attempt < self.MAX_RETRIES - 1:
                     logger.warning(
@@ -192,9 +350,8 @@ class OpenRouterClient:
                         self.MAX_RETRIES,
                         str(e),
                     )
-                    import asyncio
-
-                    await asyncio.sleep(self.RETRY_DELAY_SECONDS * (attempt + 1))
+                    delay = self._next_delay(delay)
+                    await asyncio.sleep(delay)
                     last_error = e
                 else:
                     raise OpenRouterError(f"Request timeout after {self.MAX_RETRIES} attempts")
@@ -206,9 +363,8 @@ class OpenRouterClient:
                         self.MAX_RETRIES,
                         str(e),
                     )
-                    import asyncio
-
-                    await asyncio.sleep(self.RETRY_DELAY_SECONDS * (attempt + 1))
+                    delay = self._next_delay(delay)
+                    await asyncio.sleep(delay)
                     last_error = e
                 else:
                     raise OpenRouterError(f"Request failed after {self.MAX_RETRIES} attempts: {e}")
@@ -216,24 +372,81 @@ class OpenRouterClient:
         # Should not reach here, but just in case
         raise OpenRouterError(f"Unexpected error: {last_error}")
 
+    async def _read_stream(self, response: httpx.Response, model: str) -> ChatCompletion:
+        """Assemble a ChatCompletion from a server-sent event stream.
+
+        Content deltas are parsed as they arrive, so only the current event
+        and the accumulated text are held in memory.
+        """
+        parts: list[str] = []
+        usage: dict[str, int] = {}
+        saw_choices = False
+
+        async for line in response.aiter_lines():
+            # Skip blank separators and SSE comments (keep-alive pings)
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+
+            try:
+                chunk = loads(data)
+            except ValueError as e:
+                raise OpenRouterError(f"Malformed stream event: {data[:200]}") from e
+            if not isinstance(chunk, dict):
+                raise OpenRouterError(f"Malformed stream event: {data[:200]}")
+            if "error" in chunk:
+                err = chunk["error"]
+                message = err.get("message", err) if isinstance(err, dict) else err
+                raise OpenRouterError(f"OpenRouter stream error: {message}")
+
+            model = chunk.get("model", model)
+            if chunk.get("usage"):
+                usage = chunk["usage"]
+
+            choices = chunk.get("choices")
+            if choices:
+                saw_choices = True
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    parts.append(delta)
+
+        if not saw_choices:
+            raise OpenRouterError("No choices in response")
+
+        return ChatCompletion(
+            content="".join(parts),
+            model=model,
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            total_tokens=usage.get("total_tokens", 0),
+        )
+
     async def verify_connection(self) -> bool:
         """
         Verify that the OpenRouter API connection is working.
 
+        Uses the key metadata endpoint, which is free and does not count
+        against the chat rate limit.
+
         Returns:
             True if connection works, False otherwise
         """
         try:
-            # Send a minimal request to check auth
-            await self.chat(
-                messages=[ChatMessage(role="user", content="Hi")],
-                max_tokens=1,
-            )
+            response = await self.client.get(f"{self.base_url}/auth/key", headers=self._headers)
+        except httpx.HTTPError as e:
+            logger.error("OpenRouter connection failed: %s", str(e))
+            return False
+
+        if response.status_code == 200:
             logger.info("OpenRouter API connection verified")
             return True
-        except OpenRouterAuthError as e:
-            logger.error("OpenRouter authentication failed: %s", str(e))
-            return False
-        except OpenRouterError as e:
-            logger.error("OpenRouter connection failed: %s", str(e))
+        if response.status_code == 401:
+            logger.error("OpenRouter authentication failed: Invalid API key")
             return False
+
+        logger.error(
+            "OpenRouter connection failed: HTTP %d: %s", response.status_code, response.text
+        )
+        return False
@@ -1,6 +1,8 @@
 """FastAPI application entry point."""
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+
+from community_scout.serialization import dumps
 
 app = FastAPI(
     title="Community Scout",
@@ -8,18 +10,24 @@ app = FastAPI(
     version="0.2.0",
 )
 
+# Static response bodies, serialized once at import
+_HEALTH_BODY = dumps({"status": "healthy"})
+_ROOT_BODY = dumps(
+    {
+        "service": "Community Scout",
+        "status": "running",
+        "docs": "/docs",
+    }
+)
+
 
 @app.get("/health")
-async def health() -> dict[str, str]:
+async def health() -> Response:
     """Health check endpoint."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/")
-async def root() -> dict[str, str]:
+async def root() -> Response:
     """Root endpoint."""
-    return {
-        "service": "Community Scout",
-        "status": "running",
-        "docs": "/docs",
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
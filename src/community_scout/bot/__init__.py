@@ -3,6 +3,7 @@
 from community_scout.bot.bot import (
     CommunityScoutBot,
     get_bot,
+    run_bot,
     start_bot,
     stop_bot,
     verify_bot_connection,
@@ -14,6 +15,7 @@ from community_scout.bot.onboarding import on_member_join_handler, setup_member
 __all__ = [
     "CommunityScoutBot",
     "get_bot",
+    "run_bot",
     "start_bot",
     "stop_bot",
     "verify_bot_connection",
@@ -1,51 +1,107 @@
 """Discord bot core module."""
 
+import hashlib
+import json
 import logging
 
 import discord
+import httpx
+from discord import app_commands
 from discord.ext import commands
 
-from community_scout.config import settings
+from community_scout.bot.onboarding import on_member_join_handler
+from community_scout.bot.state import get_bot_state, set_bot_state
+from community_scout.config import get_settings
+from community_scout.database import async_session_maker, warm_pool
+from community_scout.logging_setup import configure_queue_logging
+from community_scout.runtime import run
 
 logger = logging.getLogger(__name__)
 
+DISCORD_API_BASE_URL = "https://discord.com/api/v10"
+
+# Gateway intents shared by every bot instance
+_INTENTS = discord.Intents.default()
+_INTENTS.message_content = True
+_INTENTS.members = True  # Required for on_member_join
+
+
+def command_tree_hash(
+    tree: app_commands.CommandTree[discord.Client], guild: discord.abc.Snowflake | None
+) -> str:
+    """Compute a stable hash of the commands that would be synced.
+
+    Args:
+        tree: Command tree
+        guild: Guild to hash commands for, or None for global commands
+
+    Returns:
+        Hex digest of the serialized command payloads
+    """
+    payload = sorted(
+        (command.to_dict(tree) for command in tree.get_commands(guild=guild)),
+        key=lambda command: str(command["name"]),
+    )
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
 
 class CommunityScoutBot(commands.Bot):
     """Discord bot for Community Scout notifications."""
 
     def __init__(self) -> None:
         """Initialize the bot with required intents."""
-        intents = discord.Intents.default()
-        intents.message_content = True
-        intents.members = True  # Required for on_member_join
-
         super().__init__(
             command_prefix="!scout ",
-            intents=intents,
+            intents=_INTENTS,
             description="Community Scout - Content monitoring with AI summaries",
         )
 
         self._bot_ready = False
+        guild_id = get_settings().discord_guild_id
+        self._guild: discord.Object | None = discord.Object(id=int(guild_id)) if guild_id else None
 
     async def setup_hook(self) -> None:
         """Called when the bot is starting up."""
         logger.info("Bot setup hook called")
 
+        # Open pooled DB connections before interactions start arriving
+        await warm_pool(get_settings().database_pool_size)
+
         # Set up slash commands
         from community_scout.bot.commands import setup_commands
 
         await setup_commands(self)
 
-        # Sync commands to guild
-        if settings.discord_guild_id:
-            guild = discord.Object(id=int(settings.discord_guild_id))
-            self.tree.copy_global_to(guild=guild)
-            await self.tree.sync(guild=guild)
-            logger.info("Synced commands to guild %s", settings.discord_guild_id)
+        if self._guild is not None:
+            self.tree.copy_global_to(guild=self._guild)
+        await self.sync_commands()
+
+    async def sync_commands(self) -> None:
+        """Sync slash commands to Discord, skipping the call if nothing changed.
+
+        Guild syncs are rate limited, so the hash of the last synced command
+        tree is stored in bot_state and compared on startup.
+        """
+        guild = self._guild
+        key = f"command_sync_hash:{guild.id if guild is not None else 'global'}"
+        tree_hash = command_tree_hash(self.tree, guild)
+
+        async with async_session_maker() as session:
+            synced_hash = await get_bot_state(session, key)
+        if synced_hash == tree_hash:
+            logger.info("Command tree unchanged, skipping sync")
+            return
+
+        await self.tree.sync(guild=guild)
+        if guild is not None:
+            logger.info("Synced commands to guild %s", guild.id)
         else:
-            await self.tree.sync()
             logger.info("Synced commands globally")
 
+        async with async_session_maker() as session:
+            await set_bot_state(session, key, tree_hash)
+            await session.commit()
+
     async def on_ready(self) -> None:
         """Called when the bot is ready and connected."""
         self._bot_ready = True
@@ -54,8 +110,6 @@ class CommunityScoutBot(commands.Bot):
 
     async def on_member_join(self, member: discord.Member) -> None:
         """Called when a member joins a guild."""
-        from community_scout.bot.onboarding import on_member_join_handler
-
         await on_member_join_handler(member)
 
     async def on_error(self, event: str, *args: object, **kwargs: object) -> None:
@@ -82,7 +136,7 @@ def get_bot() -> CommunityScoutBot:
 
 async def start_bot() -> None:
     """Start the Discord bot."""
-    if not settings.discord_bot_token:
+    if not get_settings().discord_bot_token:
         raise ValueError(
             "Discord bot token not configured. "
             "Set DISCORD_BOT_TOKEN environment variable."
@@ -92,12 +146,21 @@ async def start_bot() -> None:
     logger.info("Starting Discord bot...")
 
     try:
-        await bot.start(settings.discord_bot_token)
+        await bot.start(get_settings().discord_bot_token)
     except discord.LoginFailure as e:
         logger.error("Failed to login to Discord: %s", str(e))
         raise
 
 
+def run_bot() -> None:
+    """Run the Discord bot until it is stopped, using uvloop if available."""
+    listener = configure_queue_logging()
+    try:
+        run(start_bot())
+    finally:
+        listener.stop()
+
+
 async def stop_bot() -> None:
     """Stop the Discord bot gracefully."""
     global _bot
@@ -109,26 +172,31 @@ async def stop_bot() -> None:
 
 async def verify_bot_connection() -> bool:
     """
-    Verify the bot token is valid by making a test connection.
+    Verify the bot token is valid with a single REST call to Discord.
 
     Returns:
         True if the token is valid, False otherwise.
     """
-    if not settings.discord_bot_token:
+    if not get_settings().discord_bot_token:
         logger.error("Discord bot token not configured")
         return False
 
     try:
-        # Create a temporary client to test the token
-        async with discord.Client(intents=discord.Intents.default()):
-            # on_ready is called when connected
-            # We just need to verify we can connect
-            pass
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            response = await client.get(
+                f"{DISCORD_API_BASE_URL}/users/@me",
+                headers={"Authorization": f"Bot {get_settings().discord_bot_token}"},
+            )
+    except httpx.HTTPError as e:
+        logger.error("Failed to verify Discord connection: %s", str(e))
+        return False
+
+    if response.status_code == 200:
         logger.info("Discord bot token verified")
         return True
-    except discord.LoginFailure as e:
-        logger.error("Discord bot token invalid: %s", str(e))
-        return False
-    except Exception as e:
-        logger.error("Failed to verify Discord connection: %s", str(e))
+    if response.status_code == 401:
+        logger.error("Discord bot token invalid")
         return False
+
+    logger.error("Failed to verify Discord connection: HTTP %d", response.status_code)
+    return False
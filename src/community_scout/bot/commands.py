@@ -1,12 +1,19 @@
 """Discord slash commands for Community Scout."""
 
+import asyncio
+import functools
 import logging
+from collections.abc import Callable, Coroutine
+from typing import Any, ParamSpec
 
 import discord
 from discord import app_commands
-from sqlalchemy import select
+from sqlalchemy import exists, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from community_scout.database import async_session_maker
+from community_scout.bot.user_cache import get_user_fields, invalidate_user
+from community_scout.config import get_settings
+from community_scout.database import async_session_maker, ro_exec
 from community_scout.models import DiscordUser, UserKeyword
 
 logger = logging.getLogger(__name__)
@@ -14,6 +21,64 @@ logger = logging.getLogger(__name__)
 MAX_KEYWORD_LENGTH = 100
 MAX_KEYWORDS_PER_USER = 50
 
+P = ParamSpec("P")
+
+# Bounds concurrent command bodies to the DB pool size, so a burst of
+# interactions queues here instead of timing out waiting for a connection
+_handler_sem = asyncio.Semaphore(get_settings().database_pool_size)
+
+
+def defer_ephemeral(
+    func: Callable[P, Coroutine[Any, Any, None]],
+) -> Callable[P, Coroutine[Any, Any, None]]:
+    """Defer the interaction as ephemeral before running the command body.
+
+    Discord drops interactions that get no response within 3 seconds, which a
+    slow database round trip can exceed. After deferring, the command has 15
+    minutes to reply and must use ``interaction.followup.send``. The body
+    then runs under the handler semaphore.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> None:
+        interaction = next(arg for arg in args if isinstance(arg, discord.Interaction))
+        await interaction.response.defer(ephemeral=True)
+        async with _handler_sem:
+            await func(*args, **kwargs)
+
+    return wrapper
+
+
+async def set_user_active(session: AsyncSession, discord_id: str, is_active: bool) -> bool | None:
+    """Set a user's notification state with a single UPDATE.
+
+    Args:
+        session: Database session
+        discord_id: Discord user ID
+        is_active: Desired notification state
+
+    Returns:
+        True if the state changed, False if it was already set,
+        None if the user does not exist
+    """
+    result = await session.execute(
+        update(DiscordUser)
+        .where(
+            DiscordUser.discord_id == discord_id,
+            DiscordUser.is_active == (not is_active),
+        )
+        .values(is_active=is_active)
+        .returning(DiscordUser.id)
+    )
+    if result.first() is not None:
+        return True
+
+    # Nothing updated: distinguish "already in that state" from "unknown user"
+    user_exists = await session.scalar(
+        select(exists().where(DiscordUser.discord_id == discord_id))
+    )
+    return False if user_exists else None
+
 
 class KeywordGroup(app_commands.Group):
     """Commands for managing keywords to monitor."""
@@ -23,66 +88,55 @@ class KeywordGroup(app_commands.Group):
 
     @app_commands.command(name="add", description="Add a keyword to monitor")
     @app_commands.describe(phrase="The keyword or phrase to monitor (max 100 chars)")
+    @defer_ephemeral
     async def add(self, interaction: discord.Interaction, phrase: str) -> None:
         """Add a keyword to monitor."""
         # Validate input
         phrase = phrase.strip()
         if not phrase:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "Keyword cannot be empty.", ephemeral=True
             )
             return
 
         if len(phrase) > MAX_KEYWORD_LENGTH:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"Keyword too long. Maximum is {MAX_KEYWORD_LENGTH} characters.",
                 ephemeral=True,
             )
             return
 
         async with async_session_maker() as session:
-            # Get user
-            result = await session.execute(
-                select(DiscordUser).where(
-                    DiscordUser.discord_id == str(interaction.user.id)
-                )
-            )
-            user = result.scalar_one_or_none()
+            user = await get_user_fields(str(interaction.user.id))
 
             if not user:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     "You're not set up yet. Please wait for your channel to be created.",
                     ephemeral=True,
                 )
                 return
 
-            # Check for duplicates
-            result = await session.execute(
-                select(UserKeyword).where(
+            # Count active keywords and duplicates in one round trip
+            is_duplicate = func.lower(UserKeyword.phrase) == phrase.lower()
+            counts = await session.execute(
+                select(
+                    func.count(UserKeyword.id),
+                    func.count(UserKeyword.id).filter(is_duplicate),
+                ).where(
                     UserKeyword.user_id == user.id,
-                    UserKeyword.phrase.ilike(phrase),
                     UserKeyword.is_active == True,  # noqa: E712
                 )
             )
-            existing = result.scalar_one_or_none()
+            keyword_count, duplicate_count = counts.one()
 
-            if existing:
-                await interaction.response.send_message(
+            if duplicate_count:
+                await interaction.followup.send(
                     f"You're already monitoring **{phrase}**.", ephemeral=True
                 )
                 return
 
-            # Check keyword count
-            result = await session.execute(
-                select(UserKeyword).where(
-                    UserKeyword.user_id == user.id,
-                    UserKeyword.is_active == True,  # noqa: E712
-                )
-            )
-            keywords = result.scalars().all()
-
-            if len(keywords) >= MAX_KEYWORDS_PER_USER:
-                await interaction.response.send_message(
+            if keyword_count >= MAX_KEYWORDS_PER_USER:
+                await interaction.followup.send(
                     f"You've reached the maximum of {MAX_KEYWORDS_PER_USER} keywords. "
                     "Remove some before adding more.",
                     ephemeral=True,
@@ -97,108 +151,95 @@ class KeywordGroup(app_commands.Group):
             logger.info(
                 "User %s added keyword: %s", interaction.user.name, phrase
             )
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"Now monitoring **{phrase}**.", ephemeral=True
             )
 
     @app_commands.command(name="remove", description="Remove a monitored keyword")
     @app_commands.describe(phrase="The keyword or phrase to stop monitoring")
+    @defer_ephemeral
     async def remove(self, interaction: discord.Interaction, phrase: str) -> None:
         """Remove a keyword from monitoring."""
         phrase = phrase.strip()
         if not phrase:
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "Please specify a keyword to remove.", ephemeral=True
             )
             return
 
         async with async_session_maker() as session:
-            # Get user
-            result = await session.execute(
-                select(DiscordUser).where(
-                    DiscordUser.discord_id == str(interaction.user.id)
-                )
-            )
-            user = result.scalar_one_or_none()
+            user = await get_user_fields(str(interaction.user.id))
 
             if not user:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     "You're not set up yet.", ephemeral=True
                 )
                 return
 
-            # Find keyword
+            # Deactivate keyword
             result = await session.execute(
-                select(UserKeyword).where(
+                update(UserKeyword)
+                .where(
                     UserKeyword.user_id == user.id,
-                    UserKeyword.phrase.ilike(phrase),
+                    func.lower(UserKeyword.phrase) == phrase.lower(),
                     UserKeyword.is_active == True,  # noqa: E712
                 )
+                .values(is_active=False)
+                .returning(UserKeyword.id)
             )
-            keyword = result.scalar_one_or_none()
 
-            if not keyword:
-                await interaction.response.send_message(
+            if result.first() is None:
+                await interaction.followup.send(
                     f"You're not monitoring **{phrase}**.", ephemeral=True
                 )
                 return
 
-            # Deactivate keyword
-            keyword.is_active = False
             await session.commit()
 
             logger.info(
                 "User %s removed keyword: %s", interaction.user.name, phrase
             )
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 f"Stopped monitoring **{phrase}**.", ephemeral=True
             )
 
     @app_commands.command(name="list", description="List all your monitored keywords")
+    @defer_ephemeral
     async def list_keywords(self, interaction: discord.Interaction) -> None:
         """List all monitored keywords."""
-        async with async_session_maker() as session:
-            # Get user
-            user_result = await session.execute(
-                select(DiscordUser).where(
-                    DiscordUser.discord_id == str(interaction.user.id)
-                )
-            )
-            user = user_result.scalar_one_or_none()
-
-            if not user:
-                await interaction.response.send_message(
-                    "You're not set up yet.", ephemeral=True
-                )
-                return
+        user = await get_user_fields(str(interaction.user.id))
 
-            # Get keywords
-            kw_result = await session.execute(
-                select(UserKeyword)
-                .where(
-                    UserKeyword.user_id == user.id,
-                    UserKeyword.is_active == True,  # noqa: E712
-                )
-                .order_by(UserKeyword.created_at)
+        if not user:
+            await interaction.followup.send(
+                "You're not set up yet.", ephemeral=True
             )
-            keywords = kw_result.scalars().all()
-
-            if not keywords:
-                await interaction.response.send_message(
-                    "You're not monitoring any keywords yet.\n"
-                    "Add one with `/keyword add <phrase>`",
-                    ephemeral=True,
-                )
-                return
+            return
 
-            keyword_list = "\n".join(
-                f"- **{kw.phrase}** (added {kw.created_at.strftime('%Y-%m-%d')})"
-                for kw in keywords
+        keywords = await ro_exec(
+            select(UserKeyword.phrase, UserKeyword.created_at)
+            .where(
+                UserKeyword.user_id == user.id,
+                UserKeyword.is_active == True,  # noqa: E712
             )
-            await interaction.response.send_message(
-                f"**Your monitored keywords ({len(keywords)}):**\n{keyword_list}",
+            .order_by(UserKeyword.created_at)
+        )
+
+        if not keywords:
+            await interaction.followup.send(
+                "You're not monitoring any keywords yet.\n"
+                "Add one with `/keyword add <phrase>`",
                 ephemeral=True,
             )
+            return
+
+        keyword_list = "\n".join(
+            f"- **{kw['phrase']}** (added {kw['created_at'].date().isoformat()})"
+            for kw in keywords
+        )
+        await interaction.followup.send(
+            f"**Your monitored keywords ({len(keywords)}):**\n{keyword_list}",
+            ephemeral=True,
+        )
 
 
 class APIKeyGroup(app_commands.Group):
@@ -215,63 +256,64 @@ class APIKeyGroup(app_commands.Group):
         await interaction.response.send_modal(APIKeyModal())
 
     @app_commands.command(name="status", description="Check if your API key is configured")
+    @defer_ephemeral
     async def status(self, interaction: discord.Interaction) -> None:
         """Check API key status."""
-        async with async_session_maker() as session:
-            result = await session.execute(
-                select(DiscordUser).where(
-                    DiscordUser.discord_id == str(interaction.user.id)
-                )
-            )
-            user = result.scalar_one_or_none()
+        user = await get_user_fields(str(interaction.user.id))
 
-            if not user:
-                await interaction.response.send_message(
-                    "You're not set up yet.", ephemeral=True
-                )
-                return
+        if not user:
+            await interaction.followup.send(
+                "You're not set up yet.", ephemeral=True
+            )
+            return
 
-            if user.openrouter_api_key:
-                await interaction.response.send_message(
-                    "Your OpenRouter API key is configured. "
-                    "AI summaries will use your personal key.",
-                    ephemeral=True,
-                )
-            else:
-                await interaction.response.send_message(
-                    "No API key configured. "
-                    "Set one with `/apikey set` for personalized AI summaries.",
-                    ephemeral=True,
-                )
+        if user.openrouter_api_key:
+            await interaction.followup.send(
+                "Your OpenRouter API key is configured. "
+                "AI summaries will use your personal key.",
+                ephemeral=True,
+            )
+        else:
+            await interaction.followup.send(
+                "No API key configured. "
+                "Set one with `/apikey set` for personalized AI summaries.",
+                ephemeral=True,
+            )
 
     @app_commands.command(name="remove", description="Remove your stored API key")
+    @defer_ephemeral
     async def remove(self, interaction: discord.Interaction) -> None:
         """Remove stored API key."""
         async with async_session_maker() as session:
-            result = await session.execute(
-                select(DiscordUser).where(
-                    DiscordUser.discord_id == str(interaction.user.id)
-                )
-            )
-            user = result.scalar_one_or_none()
+            user = await get_user_fields(str(interaction.user.id))
 
             if not user:
-                await interaction.response.send_message(
+                await interaction.followup.send(
                     "You're not set up yet.", ephemeral=True
                 )
                 return
 
-            if not user.openrouter_api_key:
-                await interaction.response.send_message(
+            result = await session.execute(
+                update(DiscordUser)
+                .where(
+                    DiscordUser.id == user.id,
+                    DiscordUser.openrouter_api_key.is_not(None),
+                )
+                .values(openrouter_api_key=None)
+                .returning(DiscordUser.id)
+            )
+
+            if result.first() is None:
+                await interaction.followup.send(
                     "You don't have an API key configured.", ephemeral=True
                 )
                 return
 
-            user.openrouter_api_key = None
             await session.commit()
+            invalidate_user(str(interaction.user.id))
 
             logger.info("User %s removed their API key", interaction.user.name)
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "Your API key has been removed.", ephemeral=True
             )
 
@@ -282,110 +324,104 @@ async def setup_commands(bot: "discord.ext.commands.Bot") -> None:
     bot.tree.add_command(APIKeyGroup())
 
     @bot.tree.command(name="status", description="Show your Community Scout configuration")
+    @defer_ephemeral
     async def status_command(interaction: discord.Interaction) -> None:
         """Show user's configuration status."""
-        async with async_session_maker() as session:
-            result = await session.execute(
-                select(DiscordUser).where(
-                    DiscordUser.discord_id == str(interaction.user.id)
-                )
+        keyword_count = (
+            select(func.count(UserKeyword.id))
+            .where(
+                UserKeyword.user_id == DiscordUser.id,
+                UserKeyword.is_active == True,  # noqa: E712
             )
-            user = result.scalar_one_or_none()
-
-            if not user:
-                await interaction.response.send_message(
-                    "You're not set up yet. Please wait for your channel to be created.",
-                    ephemeral=True,
-                )
-                return
-
-            # Get keyword count
-            result = await session.execute(
-                select(UserKeyword).where(
-                    UserKeyword.user_id == user.id,
-                    UserKeyword.is_active == True,  # noqa: E712
-                )
-            )
-            keywords = result.scalars().all()
-
-            api_status = "Configured" if user.openrouter_api_key else "Not configured"
-            notif_status = "Active" if user.is_active else "Paused"
-
-            embed = discord.Embed(
-                title="Community Scout Status",
-                color=discord.Color.blue(),
-            )
-            embed.add_field(name="Keywords", value=str(len(keywords)), inline=True)
-            embed.add_field(name="API Key", value=api_status, inline=True)
-            embed.add_field(name="Notifications", value=notif_status, inline=True)
-            embed.add_field(
-                name="Channel",
-                value=f"<#{user.channel_id}>",
-                inline=False,
+            .scalar_subquery()
+        )
+        rows = await ro_exec(
+            select(
+                DiscordUser.channel_id,
+                DiscordUser.is_active,
+                DiscordUser.openrouter_api_key.is_not(None).label("has_api_key"),
+                keyword_count.label("keyword_count"),
+            ).where(DiscordUser.discord_id == str(interaction.user.id))
+        )
+
+        if not rows:
+            await interaction.followup.send(
+                "You're not set up yet. Please wait for your channel to be created.",
+                ephemeral=True,
             )
+            return
 
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        user = rows[0]
+        api_status = "Configured" if user["has_api_key"] else "Not configured"
+        notif_status = "Active" if user["is_active"] else "Paused"
+
+        embed = discord.Embed(
+            title="Community Scout Status",
+            color=discord.Color.blue(),
+        )
+        embed.add_field(name="Keywords", value=str(user["keyword_count"]), inline=True)
+        embed.add_field(name="API Key", value=api_status, inline=True)
+        embed.add_field(name="Notifications", value=notif_status, inline=True)
+        embed.add_field(
+            name="Channel",
+            value=f"<#{user['channel_id']}>",
+            inline=False,
+        )
+
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @bot.tree.command(name="pause", description="Pause notifications")
+    @defer_ephemeral
     async def pause_command(interaction: discord.Interaction) -> None:
         """Pause notifications for the user."""
         async with async_session_maker() as session:
-            result = await session.execute(
-                select(DiscordUser).where(
-                    DiscordUser.discord_id == str(interaction.user.id)
-                )
-            )
-            user = result.scalar_one_or_none()
+            changed = await set_user_active(session, str(interaction.user.id), False)
 
-            if not user:
-                await interaction.response.send_message(
+            if changed is None:
+                await interaction.followup.send(
                     "You're not set up yet.", ephemeral=True
                 )
                 return
 
-            if not user.is_active:
-                await interaction.response.send_message(
+            if not changed:
+                await interaction.followup.send(
                     "Notifications are already paused.", ephemeral=True
                 )
                 return
 
-            user.is_active = False
             await session.commit()
+            invalidate_user(str(interaction.user.id))
 
             logger.info("User %s paused notifications", interaction.user.name)
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "Notifications paused. Use `/resume` to start receiving them again.",
                 ephemeral=True,
             )
 
     @bot.tree.command(name="resume", description="Resume notifications")
+    @defer_ephemeral
     async def resume_command(interaction: discord.Interaction) -> None:
         """Resume notifications for the user."""
         async with async_session_maker() as session:
-            result = await session.execute(
-                select(DiscordUser).where(
-                    DiscordUser.discord_id == str(interaction.user.id)
-                )
-            )
-            user = result.scalar_one_or_none()
+            changed = await set_user_active(session, str(interaction.user.id), True)
 
-            if not user:
-                await interaction.response.send_message(
+            if changed is None:
+                await interaction.followup.send(
                     "You're not set up yet.", ephemeral=True
                 )
                 return
 
-            if user.is_active:
-                await interaction.response.send_message(
+            if not changed:
+                await interaction.followup.send(
                     "Notifications are already active.", ephemeral=True
                 )
                 return
 
-            user.is_active = True
             await session.commit()
+            invalidate_user(str(interaction.user.id))
 
             logger.info("User %s resumed notifications", interaction.user.name)
-            await interaction.response.send_message(
+            await interaction.followup.send(
                 "Notifications resumed! You'll now receive alerts for your keywords.",
                 ephemeral=True,
             )
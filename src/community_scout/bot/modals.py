@@ -3,8 +3,9 @@
 import logging
 
 import discord
-from sqlalchemy import select
+from sqlalchemy import update
 
+from community_scout.bot.user_cache import invalidate_user
 from community_scout.crypto import encrypt
 from community_scout.database import async_session_maker
 from community_scout.models import DiscordUser
@@ -36,25 +37,25 @@ class APIKeyModal(discord.ui.Modal, title="Set OpenRouter API Key"):
             )
             return
 
+        encrypted_key = encrypt(key_value)
+
         async with async_session_maker() as session:
             result = await session.execute(
-                select(DiscordUser).where(
-                    DiscordUser.discord_id == str(interaction.user.id)
-                )
+                update(DiscordUser)
+                .where(DiscordUser.discord_id == str(interaction.user.id))
+                .values(openrouter_api_key=encrypted_key)
+                .returning(DiscordUser.id)
             )
-            user = result.scalar_one_or_none()
 
-            if not user:
+            if result.first() is None:
                 await interaction.response.send_message(
                     "You're not set up yet. Please wait for your channel to be created.",
                     ephemeral=True,
                 )
                 return
 
-            # Encrypt and store
-            encrypted_key = encrypt(key_value)
-            user.openrouter_api_key = encrypted_key
             await session.commit()
+            invalidate_user(str(interaction.user.id))
 
             logger.info("User %s configured their API key", interaction.user.name)
             await interaction.response.send_message(
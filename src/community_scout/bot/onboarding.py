@@ -1,12 +1,15 @@
 """Discord member onboarding for Community Scout."""
 
+import asyncio
 import logging
+import re
 
 import discord
-from sqlalchemy import select
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from community_scout.config import settings
-from community_scout.database import async_session_maker
+from community_scout.config import get_settings
+from community_scout.database import async_session_maker, dialect_insert
 from community_scout.models import ContentSource, DiscordUser, SourceThread
 
 logger = logging.getLogger(__name__)
@@ -23,6 +26,51 @@ I'll monitor Hacker News for topics you care about and notify you here.
 Your alerts will appear in the thread below. Happy monitoring!"""
 
 
+# Runs of anything but letters and digits become a single dash in channel names
+_NON_ALNUM = re.compile(r"[\W_]+")
+
+# Content source IDs never change once the row exists
+_source_id_cache: dict[str, int] = {}
+
+
+async def get_or_create_source_id(session: AsyncSession, name: str) -> int:
+    """
+    Get the ID of a content source, creating the source if needed.
+
+    Only IDs of rows that were already in the database are cached; a row
+    inserted here is not committed yet and may still be rolled back.
+
+    Args:
+        session: Database session
+        name: Content source name (e.g., "hackernews")
+
+    Returns:
+        The content source ID
+    """
+    cached = _source_id_cache.get(name)
+    if cached is not None:
+        return cached
+
+    source_id = await session.scalar(select(ContentSource.id).where(ContentSource.name == name))
+    if source_id is not None:
+        _source_id_cache[name] = source_id
+        return source_id
+
+    inserted_id = await session.scalar(
+        dialect_insert(session, ContentSource)
+        .values(name=name, is_active=True)
+        .on_conflict_do_nothing(index_elements=["name"])
+        .returning(ContentSource.id)
+    )
+    if inserted_id is not None:
+        return int(inserted_id)
+
+    # Created concurrently between the SELECT and the INSERT
+    return (
+        await session.scalars(select(ContentSource.id).where(ContentSource.name == name))
+    ).one()
+
+
 async def create_user_channel(
     guild: discord.Guild, member: discord.Member
 ) -> discord.TextChannel | None:
@@ -37,8 +85,7 @@ async def create_user_channel(
         The created channel, or None if creation failed
     """
     # Sanitize username for channel name (Discord allows alphanumeric and dashes)
-    safe_name = "".join(c if c.isalnum() else "-" for c in member.name.lower())
-    safe_name = safe_name.strip("-")[:20]  # Limit length
+    safe_name = _NON_ALNUM.sub("-", member.name.lower()).strip("-")[:20]  # Limit length
     channel_name = f"alerts-{safe_name}"
 
     # Set up permissions: only user + bot can see
@@ -121,54 +168,53 @@ async def setup_member(bot: discord.ext.commands.Bot, member: discord.Member) ->
     """
     guild = member.guild
 
-    # Check if user already exists
     async with async_session_maker() as session:
-        user_result = await session.execute(
-            select(DiscordUser).where(DiscordUser.discord_id == str(member.id))
+        # Check if user already exists
+        existing = await session.scalar(
+            select(exists().where(DiscordUser.discord_id == str(member.id)))
         )
-        existing = user_result.scalar_one_or_none()
 
         if existing:
             logger.info("User %s already exists in database", member.name)
             return True
 
-    # Create private channel
-    channel = await create_user_channel(guild, member)
-    if not channel:
-        return False
-
-    # Create database records
-    async with async_session_maker() as session:
-        # Create user record
-        user = DiscordUser(
-            discord_id=str(member.id),
-            discord_username=member.name,
-            channel_id=str(channel.id),
-            is_active=True,
+        # Create private channel while the Hacker News source is looked up
+        channel, source_id = await asyncio.gather(
+            create_user_channel(guild, member),
+            get_or_create_source_id(session, "hackernews"),
         )
-        session.add(user)
-        await session.flush()  # Get user.id
-
-        # Get or create Hacker News source
-        source_result = await session.execute(
-            select(ContentSource).where(ContentSource.name == "hackernews")
+        if not channel:
+            return False
+
+        # Create user record; a redelivered join event may race this one
+        user_id = await session.scalar(
+            dialect_insert(session, DiscordUser)
+            .values(
+                discord_id=str(member.id),
+                discord_username=member.name,
+                channel_id=str(channel.id),
+                is_active=True,
+            )
+            .on_conflict_do_nothing(index_elements=["discord_id"])
+            .returning(DiscordUser.id)
         )
-        hn_source = source_result.scalar_one_or_none()
 
-        if not hn_source:
-            hn_source = ContentSource(name="hackernews", is_active=True)
-            session.add(hn_source)
-            await session.flush()
+        if user_id is None:
+            logger.info("User %s was set up concurrently, removing extra channel", member.name)
+            try:
+                await channel.delete(reason="Duplicate Community Scout channel")
+            except discord.HTTPException as e:
+                logger.error("Failed to delete duplicate channel %s: %s", channel.name, e)
+            return True
 
         # Create source thread
         thread = await create_source_thread(channel, "Hacker News")
         if thread:
-            source_thread = SourceThread(
-                user_id=user.id,
-                source_id=hn_source.id,
-                thread_id=str(thread.id),
+            await session.execute(
+                dialect_insert(session, SourceThread)
+                .values(user_id=user_id, source_id=source_id, thread_id=str(thread.id))
+                .on_conflict_do_nothing(index_elements=["source_id", "thread_id"])
             )
-            session.add(source_thread)
 
         await session.commit()
         logger.info("Created database records for user %s", member.name)
@@ -195,7 +241,8 @@ async def on_member_join_handler(member: discord.Member) -> None:
         return
 
     # Check if this is our target guild
-    if settings.discord_guild_id and str(member.guild.id) != settings.discord_guild_id:
+    guild_id = get_settings().discord_guild_id
+    if guild_id and str(member.guild.id) != guild_id:
         logger.debug(
             "Member joined different guild (%s), skipping", member.guild.name
         )
@@ -0,0 +1,41 @@
+"""Bot state management."""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from community_scout.database import dialect_insert
+from community_scout.models import BotState
+
+
+async def get_bot_state(session: AsyncSession, key: str) -> str | None:
+    """Get a stored bot state value.
+
+    Args:
+        session: Database session
+        key: State key (e.g., "command_sync_hash:<guild_id>")
+
+    Returns:
+        Stored value, or None if the key has never been set
+    """
+    stmt = select(BotState.value).where(BotState.key == key)
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def set_bot_state(session: AsyncSession, key: str, value: str) -> None:
+    """Create or update a bot state value.
+
+    Args:
+        session: Database session
+        key: State key
+        value: Value to store
+    """
+    now = datetime.now(UTC)
+    stmt = dialect_insert(session, BotState).values(key=key, value=value, updated_at=now)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["key"],
+        set_={"value": stmt.excluded.value, "updated_at": stmt.excluded.updated_at},
+    )
+    await session.execute(stmt)
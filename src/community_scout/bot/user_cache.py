@@ -0,0 +1,64 @@
+"""Short-lived cache of Discord user rows for slash command handlers."""
+
+from dataclasses import dataclass
+
+from cachetools import TTLCache
+from sqlalchemy import select
+
+from community_scout.database import ro_exec
+from community_scout.models import DiscordUser
+
+USER_CACHE_SIZE = 10_000
+USER_CACHE_TTL_SECONDS = 60
+
+
+@dataclass(slots=True, frozen=True)
+class CachedUser:
+    """The DiscordUser columns command handlers need."""
+
+    id: int
+    channel_id: str
+    is_active: bool
+    openrouter_api_key: str | None
+
+
+_user_cache: TTLCache[str, CachedUser] = TTLCache(
+    maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL_SECONDS
+)
+
+
+async def get_user_fields(discord_id: str) -> CachedUser | None:
+    """Get a user's fields, from the cache when possible.
+
+    Unknown users are not cached, so a user is found as soon as onboarding
+    creates their row.
+
+    Args:
+        discord_id: Discord user ID
+
+    Returns:
+        Cached user fields, or None if the user is not set up
+    """
+    cached = _user_cache.get(discord_id)
+    if cached is not None:
+        return cached
+
+    rows = await ro_exec(
+        select(
+            DiscordUser.id,
+            DiscordUser.channel_id,
+            DiscordUser.is_active,
+            DiscordUser.openrouter_api_key,
+        ).where(DiscordUser.discord_id == discord_id)
+    )
+    if not rows:
+        return None
+
+    user = CachedUser(**rows[0])
+    _user_cache[discord_id] = user
+    return user
+
+
+def invalidate_user(discord_id: str) -> None:
+    """Drop a user from the cache after their row changes."""
+    _user_cache.pop(discord_id, None)
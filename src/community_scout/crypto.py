@@ -1,9 +1,10 @@
 """Encryption utilities for sensitive data like API keys."""
 
+import functools
 
 from cryptography.fernet import Fernet, InvalidToken
 
-from community_scout.config import settings
+from community_scout.config import get_settings
 
 
 class EncryptionError(Exception):
@@ -12,9 +13,14 @@ class EncryptionError(Exception):
     pass
 
 
+@functools.cache
 def _get_fernet() -> Fernet:
-    """Get a Fernet instance using the configured encryption key."""
-    key = settings.encryption_key
+    """Get a Fernet instance using the configured encryption key.
+
+    The key is fixed for the life of the process, so the instance is built
+    once. Errors are not cached.
+    """
+    key = get_settings().encryption_key
     if not key:
         raise EncryptionError(
             "ENCRYPTION_KEY not configured. Generate one with: "
@@ -1,15 +1,63 @@
 """Database connection and session management."""
 
-from collections.abc import AsyncGenerator
+import asyncio
+from collections.abc import AsyncGenerator, Sequence
+from typing import Any
 
+from sqlalchemy import Executable, RowMapping, make_url
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import QueuePool
 
-from community_scout.config import settings
+from community_scout.config import get_settings
 
-engine = create_async_engine(settings.database_url, echo=False)
+_settings = get_settings()
+
+# Statements cached per connection; the hot command queries are a small fixed set
+STATEMENT_CACHE_SIZE = 500
+
+
+def _connect_args(database_url: str) -> dict[str, Any]:
+    """Build driver connect arguments for the configured database.
+
+    For asyncpg, size the prepared statement caches and turn off JIT, which
+    only adds planning overhead for short transactional queries.
+    """
+    if make_url(database_url).get_driver_name() != "asyncpg":
+        return {}
+    return {
+        "prepared_statement_cache_size": STATEMENT_CACHE_SIZE,
+        "statement_cache_size": STATEMENT_CACHE_SIZE,
+        "server_settings": {"jit": "off"},
+    }
+
+
+# Sized for bursty slash-command traffic alongside the scanner and notifier
+engine = create_async_engine(
+    _settings.database_url,
+    echo=False,
+    connect_args=_connect_args(_settings.database_url),
+    pool_size=_settings.database_pool_size,
+    max_overflow=_settings.database_max_overflow,
+    pool_timeout=_settings.database_pool_timeout,
+    pool_recycle=_settings.database_pool_recycle,
+    pool_pre_ping=True,
+    pool_use_lifo=True,
+)
 async_session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+async def ro_exec(stmt: Executable) -> Sequence[RowMapping]:
+    """Run a read-only statement on a plain pooled connection.
+
+    Skips the ORM session (identity map, unit of work) for simple reads
+    whose results are used as plain rows.
+    """
+    async with engine.connect() as conn:
+        result = await conn.execute(stmt)
+        return result.mappings().all()
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting database sessions."""
     async with async_session_maker() as session:
@@ -19,3 +67,38 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+
+
+async def warm_pool(n: int) -> None:
+    """Open n pooled connections up front and return them to the pool idle.
+
+    Saves the first burst of requests after startup from paying connection
+    setup cost. n should not exceed the pool size, since overflow
+    connections are closed rather than pooled when released.
+    """
+    connections = await asyncio.gather(*(engine.connect() for _ in range(n)))
+    await asyncio.gather(*(connection.close() for connection in connections))
+
+
+def pool_stats() -> dict[str, int]:
+    """Return connection pool usage counters for logging/monitoring."""
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
+def dialect_insert(session: AsyncSession, entity: Any) -> postgresql.Insert | sqlite.Insert:
+    """Build an INSERT for the session's dialect that supports ON CONFLICT.
+
+    Production runs on PostgreSQL; tests run on SQLite. Both dialects expose
+    ``on_conflict_do_nothing``/``on_conflict_do_update`` with the same shape.
+    """
+    if session.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(entity)
+    return postgresql.insert(entity)
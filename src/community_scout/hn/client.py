@@ -2,17 +2,70 @@
 
 import asyncio
 import logging
+import random
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
-from datetime import UTC, datetime
 
 import httpx
 
+from community_scout.serialization import loads
+
 logger = logging.getLogger(__name__)
 
 HN_API_BASE_URL = "https://hacker-news.firebaseio.com/v0"
 
+_VALID_TYPES = frozenset({"story", "comment"})
+
+# Shared across HNClient instances so scans reuse warm keep-alive connections
+_shared_client: httpx.AsyncClient | None = None
+
 
-@dataclass
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get the process-wide HTTP client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30,
+            ),
+        )
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the shared HTTP client, e.g. on shutdown."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
+
+def parse_update_item_ids(payload: object) -> list[int]:
+    """Extract item IDs from a put/patch event of the updates stream.
+
+    The first event puts the whole document ({"items": [...], "profiles":
+    [...]}) at "/"; later ones may only replace the "/items" list.
+    """
+    if not isinstance(payload, dict):
+        return []
+    path = payload.get("path")
+    data = payload.get("data")
+    if path == "/" and isinstance(data, dict):
+        data = data.get("items")
+    elif path != "/items":
+        return []
+    if isinstance(data, dict):
+        # Patches address list entries by index
+        data = list(data.values())
+    if not isinstance(data, list):
+        return []
+    return [x for x in data if type(x) is int]
+
+
+@dataclass(slots=True, frozen=True)
 class HNItemData:
     """Parsed Hacker News item data."""
 
@@ -24,7 +77,7 @@ class HNItemData:
     author: str
     score: int
     parent_id: int | None
-    created_at: datetime
+    created_utc: int  # Unix epoch seconds, as returned by the API
 
     @classmethod
     def from_api_response(cls, data: dict[str, object]) -> "HNItemData | None":
@@ -32,12 +85,13 @@ class HNItemData:
 
         Returns None if the item is deleted, dead, or not a story/comment.
         """
-        # Skip deleted or dead items
-        if data.get("deleted") or data.get("dead"):
+        # The type check rejects most unwanted items (jobs, polls), so do it first
+        item_type = data.get("type")
+        if item_type not in _VALID_TYPES:
             return None
 
-        item_type = data.get("type")
-        if item_type not in ("story", "comment"):
+        # Skip deleted or dead items
+        if data.get("deleted") or data.get("dead"):
             return None
 
         # Extract required fields with safe defaults
@@ -45,10 +99,11 @@ class HNItemData:
         author = data.get("by")
         time_val = data.get("time")
 
-        if not isinstance(item_id, int) or not author or not time_val:
+        if not isinstance(item_id, int) or not author or not isinstance(time_val, int):
             return None
 
-        score_val = data.get("score", 0)
+        # JSON numbers already decode to int; anything else is malformed
+        score_val = data.get("score")
         parent_val = data.get("parent")
 
         return cls(
@@ -58,9 +113,9 @@ class HNItemData:
             text=str(data["text"]) if data.get("text") else None,
             url=str(data["url"]) if data.get("url") else None,
             author=str(author),
-            score=int(str(score_val)) if score_val else 0,
-            parent_id=int(str(parent_val)) if parent_val else None,
-            created_at=datetime.fromtimestamp(int(str(time_val)), tz=UTC),
+            score=score_val if isinstance(score_val, int) else 0,
+            parent_id=parent_val if isinstance(parent_val, int) else None,
+            created_utc=time_val,
         )
 
 
@@ -83,21 +138,30 @@ class HNClient:
             retry_delay: Base delay between retries (exponential backoff)
         """
         self.base_url = base_url
+        # URLs built once; item lookups run in the batch fetch hot loop
+        self._item_url_tmpl = f"{base_url}/item/%d.json"
+        self._max_item_url = f"{base_url}/maxitem.json"
+        self._new_stories_url = f"{base_url}/newstories.json"
+        self._updates_url = f"{base_url}/updates.json"
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        # Exponential backoff schedule, computed once; jitter is applied per retry
+        self._backoff = tuple(retry_delay * (2**i) for i in range(max_retries))
         self._client: httpx.AsyncClient | None = None
 
     async def __aenter__(self) -> "HNClient":
-        """Enter async context."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        """Enter async context.
+
+        Uses the shared HTTP client; connections stay open after exit so the
+        next scan can reuse them. Call close_shared_client() on shutdown.
+        """
+        self._client = _get_shared_client()
         return self
 
     async def __aexit__(self, *args: object) -> None:
         """Exit async context."""
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        self._client = None
 
     @property
     def client(self) -> httpx.AsyncClient:
@@ -113,46 +177,30 @@ class HNClient:
         """
         for attempt in range(self.max_retries):
             try:
-                response = await self.client.get(url)
+                response = await self.client.get(url, timeout=self.timeout)
                 if response.status_code == 404:
                     return None
                 response.raise_for_status()
-                result: object = response.json()
+                result: object = loads(response.content)
                 return result
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    return None
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2**attempt)
-                    logger.warning(
-                        "Request failed (attempt %d/%d), retrying in %.1fs: %s",
-                        attempt + 1,
-                        self.max_retries,
-                        delay,
-                        e,
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    raise
-            except httpx.RequestError as e:
-                if attempt < self.max_retries - 1:
-                    delay = self.retry_delay * (2**attempt)
-                    logger.warning(
-                        "Request error (attempt %d/%d), retrying in %.1fs: %s",
-                        attempt + 1,
-                        self.max_retries,
-                        delay,
-                        e,
-                    )
-                    await asyncio.sleep(delay)
-                else:
+            except (httpx.HTTPStatusError, httpx.RequestError) as e:
+                if attempt >= self.max_retries - 1:
                     raise
+                # Jitter keeps concurrent workers from retrying in lockstep
+                delay = self._backoff[attempt] * (0.5 + random.random())
+                logger.warning(
+                    "Request failed (attempt %d/%d), retrying in %.1fs: %s",
+                    attempt + 1,
+                    self.max_retries,
+                    delay,
+                    e,
+                )
+                await asyncio.sleep(delay)
         return None
 
     async def get_max_item_id(self) -> int:
         """Get the current maximum item ID on HN."""
-        url = f"{self.base_url}/maxitem.json"
-        result = await self._request_with_retry(url)
+        result = await self._request_with_retry(self._max_item_url)
         if not isinstance(result, int):
             raise ValueError(f"Unexpected max item response: {result}")
         return result
@@ -162,19 +210,44 @@ class HNClient:
 
         Returns None if item doesn't exist, is deleted, or is not a story/comment.
         """
-        url = f"{self.base_url}/item/{item_id}.json"
-        result = await self._request_with_retry(url)
+        result = await self._request_with_retry(self._item_url_tmpl % item_id)
         if result is None or not isinstance(result, dict):
             return None
         return HNItemData.from_api_response(result)
 
     async def get_new_stories(self) -> list[int]:
         """Get list of new story IDs (most recent first)."""
-        url = f"{self.base_url}/newstories.json"
-        result = await self._request_with_retry(url)
+        result = await self._request_with_retry(self._new_stories_url)
         if not isinstance(result, list):
             return []
-        return [int(x) for x in result if isinstance(x, int)]
+        # Decoded JSON numbers are already ints; the exact type check also drops bools
+        return [x for x in result if type(x) is int]
+
+    async def stream_updates(self) -> AsyncIterator[list[int]]:
+        """Stream IDs of changed items from the Firebase updates feed.
+
+        Yields the item IDs of each put/patch event as the server pushes
+        them. The feed lists recently changed items, including new ones.
+        Ends when the server closes the stream.
+        """
+        async with self.client.stream(
+            "GET",
+            self._updates_url,
+            headers={"Accept": "text/event-stream"},
+            # Events arrive every few seconds to minutes; never time out reading
+            timeout=httpx.Timeout(self.timeout, read=None),
+        ) as response:
+            response.raise_for_status()
+            event: str | None = None
+            async for line in response.aiter_lines():
+                if line.startswith("event:"):
+                    event = line[6:].strip()
+                    if event in ("cancel", "auth_revoked"):
+                        return
+                elif line.startswith("data:") and event in ("put", "patch"):
+                    item_ids = parse_update_item_ids(loads(line[5:].strip()))
+                    if item_ids:
+                        yield item_ids
 
     async def get_items_batch(
         self, item_ids: list[int], concurrency: int = 10
@@ -188,19 +261,18 @@ class HNClient:
         Returns:
             List of successfully fetched items (skips None results)
         """
-        semaphore = asyncio.Semaphore(concurrency)
-
-        async def fetch_with_semaphore(item_id: int) -> HNItemData | None:
-            async with semaphore:
-                return await self.get_item(item_id)
-
-        tasks = [fetch_with_semaphore(item_id) for item_id in item_ids]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        items: list[HNItemData] = []
-        for result in results:
-            if isinstance(result, BaseException):
-                logger.warning("Failed to fetch item: %s", result)
-            elif isinstance(result, HNItemData):
-                items.append(result)
-        return items
+        # A fixed pool of workers pulls from a shared iterator, instead of
+        # one task per item throttled by a semaphore
+        pending = iter(enumerate(item_ids))
+        results: list[HNItemData | None] = [None] * len(item_ids)
+
+        async def worker() -> None:
+            for index, item_id in pending:
+                try:
+                    results[index] = await self.get_item(item_id)
+                except Exception as e:
+                    logger.warning("Failed to fetch item %d: %s", item_id, e)
+
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(item_ids)))))
+
+        return [item for item in results if item is not None]
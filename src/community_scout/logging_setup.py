@@ -0,0 +1,36 @@
+"""Logging configuration helpers."""
+
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def configure_queue_logging(level: int = logging.INFO) -> QueueListener:
+    """Route root logging through a queue drained by a background thread.
+
+    Logging calls on the event loop only enqueue the record; formatting and
+    the blocking stream write happen on the listener thread. Any existing
+    root handlers are replaced.
+
+    Args:
+        level: Root logger level
+
+    Returns:
+        The started listener; call ``stop()`` on shutdown to flush it
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
@@ -3,6 +3,7 @@
 from community_scout.models.base import Base, TimestampMixin
 from community_scout.models.content import (
     AlertStatus,
+    BotState,
     ContentSource,
     HNItem,
     HNItemType,
@@ -23,4 +24,5 @@ __all__ = [
     "UserAlert",
     "AlertStatus",
     "ScannerState",
+    "BotState",
 ]
@@ -1,10 +1,22 @@
 """Content models for HN items, user alerts, and scanner state."""
 
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
+from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from community_scout.models.base import Base, TimestampMixin
@@ -24,6 +36,17 @@ class ScannerState(Base):
     last_scan_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
+class BotState(Base):
+    """Small key/value store for Discord bot bookkeeping (e.g. command sync hash)."""
+
+    __tablename__ = "bot_state"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    key: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
+    value: Mapped[str] = mapped_column(Text, nullable=False)
+    updated_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
 class AlertStatus(str, Enum):
     """Status of a user alert."""
 
@@ -63,7 +86,7 @@ class HNItem(Base):
     __tablename__ = "hn_items"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    hn_id: Mapped[int] = mapped_column(Integer, unique=True, nullable=False, index=True)
+    hn_id: Mapped[int] = mapped_column(Integer, unique=True, nullable=False)
     item_type: Mapped[str] = mapped_column(String(50), nullable=False)
     title: Mapped[str | None] = mapped_column(Text, nullable=True)
     text: Mapped[str | None] = mapped_column(Text, nullable=True)
@@ -71,7 +94,8 @@ class HNItem(Base):
     author: Mapped[str] = mapped_column(String(255), nullable=False)
     score: Mapped[int] = mapped_column(Integer, default=0)
     parent_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    created_utc: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # Unix epoch seconds as returned by the HN API; see created_utc_dt
+    created_utc: Mapped[int] = mapped_column(BigInteger, nullable=False)
     discovered_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -86,19 +110,62 @@ class HNItem(Base):
         """Get the Hacker News URL for this item."""
         return f"https://news.ycombinator.com/item?id={self.hn_id}"
 
+    @property
+    def created_utc_dt(self) -> datetime:
+        """Get the item's creation time as a timezone-aware datetime."""
+        return datetime.fromtimestamp(self.created_utc, tz=UTC)
+
 
 class UserAlert(Base, TimestampMixin):
     """An alert for a user about a matched content item."""
 
     __tablename__ = "user_alerts"
+    __table_args__ = (
+        Index(
+            "ix_user_alerts_user_status_created",
+            "user_id",
+            "status",
+            text("created_at DESC"),
+            postgresql_include=["item_id", "keyword_id"],
+        ),
+        Index("ix_user_alerts_dedup", "user_id", "item_id", "keyword_id", unique=True),
+        Index(
+            "ix_user_alerts_pending",
+            "user_id",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("discord_users.id"), nullable=False)
-    item_id: Mapped[int] = mapped_column(ForeignKey("hn_items.id"), nullable=False)
-    keyword_id: Mapped[int] = mapped_column(ForeignKey("user_keywords.id"), nullable=False)
-    source_id: Mapped[int] = mapped_column(ForeignKey("content_sources.id"), nullable=False)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("discord_users.id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"),
+        nullable=False,
+    )
+    item_id: Mapped[int] = mapped_column(
+        ForeignKey("hn_items.id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"),
+        nullable=False,
+    )
+    keyword_id: Mapped[int] = mapped_column(
+        ForeignKey("user_keywords.id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"),
+        nullable=False,
+    )
+    source_id: Mapped[int] = mapped_column(
+        ForeignKey(
+            "content_sources.id", ondelete="CASCADE", deferrable=True, initially="DEFERRED"
+        ),
+        nullable=False,
+    )
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)
-    status: Mapped[str] = mapped_column(String(50), default=AlertStatus.PENDING.value)
+    # Native PostgreSQL enum: 4 bytes per row, and smaller status indexes
+    status: Mapped[str] = mapped_column(
+        SAEnum(
+            AlertStatus,
+            name="alert_status",
+            values_callable=lambda statuses: [status.value for status in statuses],
+        ),
+        default=AlertStatus.PENDING.value,
+    )
     discord_message_id: Mapped[str | None] = mapped_column(String(255), nullable=True)
 
     # Relationships
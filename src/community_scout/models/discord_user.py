@@ -2,7 +2,7 @@
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, ForeignKey, String, Text
+from sqlalchemy import Boolean, ForeignKey, Index, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from community_scout.models.base import Base, TimestampMixin
@@ -39,6 +39,20 @@ class UserKeyword(Base, TimestampMixin):
     """A keyword phrase to monitor for a user."""
 
     __tablename__ = "user_keywords"
+    __table_args__ = (
+        Index(
+            "ix_user_keywords_user_active_phrase",
+            "user_id",
+            "is_active",
+            text("lower(phrase)"),
+        ),
+        Index(
+            "ix_user_keywords_active",
+            "id",
+            postgresql_include=["phrase", "user_id"],
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("discord_users.id"), nullable=False)
@@ -56,6 +70,12 @@ class SourceThread(Base, TimestampMixin):
     """A Discord thread for a specific content source per user."""
 
     __tablename__ = "source_threads"
+    __table_args__ = (
+        Index("ix_source_threads_user_source", "user_id", "source_id"),
+        Index(
+            "ix_source_threads_source_thread_unique", "source_id", "thread_id", unique=True
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("discord_users.id"), nullable=False)
@@ -1,16 +1,22 @@
 """Alert notification service."""
 
+import asyncio
+import hashlib
 import logging
+from collections import defaultdict
 from dataclasses import dataclass
+from typing import NamedTuple
 
 import discord
-from sqlalchemy import select
+from cachetools import TTLCache
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from community_scout.ai.client import ChatMessage, OpenRouterClient, OpenRouterError
-from community_scout.config import settings
+from community_scout.config import get_settings
 from community_scout.crypto import decrypt
+from community_scout.database import dialect_insert
 from community_scout.models import (
     AlertStatus,
     ContentSource,
@@ -22,10 +28,31 @@ from community_scout.models import (
 
 logger = logging.getLogger(__name__)
 
+Channel = discord.abc.GuildChannel | discord.Thread | discord.abc.PrivateChannel
+
 SUMMARY_SYSTEM_PROMPT = """You are a helpful assistant that summarizes Hacker News content.
 Given a title and optional text/URL, write a 1-2 sentence summary explaining what it is about.
 Be concise and informative. Focus on the key points."""
 
+# ChatMessage is frozen, so every summary request can share the system message
+_SYSTEM_MSG = ChatMessage(role="system", content=SUMMARY_SYSTEM_PROMPT)
+
+# Alerts sent at once; Discord rate limits make higher values pointless
+NOTIFY_CONCURRENCY = 8
+
+# Maximum item text lengths sent to the model and shown in embeds
+SUMMARY_EXCERPT_CHARS = 1000
+DISPLAY_EXCERPT_CHARS = 300
+
+SUMMARY_CACHE_SIZE = 1024
+SUMMARY_CACHE_TTL_SECONDS = 6 * 60 * 60
+
+# SHA-256 of (model, prompt) -> summary. Users watching overlapping keywords
+# get alerts for the same item, which would otherwise be summarized once each.
+_summary_cache: TTLCache[bytes, str] = TTLCache(
+    maxsize=SUMMARY_CACHE_SIZE, ttl=SUMMARY_CACHE_TTL_SECONDS
+)
+
 
 @dataclass
 class NotifyResult:
@@ -36,6 +63,17 @@ class NotifyResult:
     alerts_failed: int
 
 
+class _EmbedInput(NamedTuple):
+    """The alert fields an embed is rendered from."""
+
+    title: str
+    url: str
+    color: discord.Color
+    author_name: str
+    meta: str
+    text: str | None
+
+
 class AlertNotifier:
     """Service for sending alerts to Discord."""
 
@@ -52,22 +90,96 @@ class AlertNotifier:
         """
         self.session = session
         self.bot = bot
+        # (user_id, source_id) -> thread_id
+        self._thread_cache: dict[tuple[int, int], str] = {}
+        # Alerts are sent concurrently: the session allows one statement at a
+        # time, and each (user, source) pair must only create one thread.
+        self._db_lock = asyncio.Lock()
+        self._thread_locks: defaultdict[tuple[int, int], asyncio.Lock] = defaultdict(
+            asyncio.Lock
+        )
+        # One OpenRouter client per API key; all share one connection pool
+        self._ai_clients: dict[str, OpenRouterClient] = {}
+        # Ciphertext -> decrypted API key
+        self._key_cache: dict[str, str] = {}
+        # Column values for sent alerts, written in one bulk UPDATE per batch
+        self._sent_updates: list[dict[str, object]] = []
+        # (item id, max length) -> truncated item text
+        self._excerpts: dict[tuple[int, int], str] = {}
+        # Resolved channels and threads, so cache misses are fetched only once
+        self._channel_cache: dict[int, Channel] = {}
+        # alert_id -> embed fields, extracted in one pass after loading a batch
+        self._embed_inputs: dict[int, _EmbedInput] = {}
+
+    async def aclose(self) -> None:
+        """Close the OpenRouter clients opened by this notifier."""
+        clients = list(self._ai_clients.values())
+        self._ai_clients.clear()
+        for client in clients:
+            await client.aclose()
+
+    def _get_ai_client(self, api_key: str) -> OpenRouterClient:
+        """Get the OpenRouter client for an API key, creating it on first use."""
+        client = self._ai_clients.get(api_key)
+        if client is None:
+            client = self._ai_clients[api_key] = OpenRouterClient(api_key=api_key)
+        return client
 
     async def get_pending_alerts(self, limit: int = 50) -> list[UserAlert]:
-        """Get pending alerts with related data loaded."""
+        """Get pending alerts with related data loaded.
+
+        All relationships are many-to-one, so they are joined into a single
+        query without multiplying rows.
+        """
         stmt = (
             select(UserAlert)
             .where(UserAlert.status == AlertStatus.PENDING.value)
             .options(
-                selectinload(UserAlert.user),
-                selectinload(UserAlert.item),
-                selectinload(UserAlert.keyword),
-                selectinload(UserAlert.source),
+                joinedload(UserAlert.user),
+                joinedload(UserAlert.item),
+                joinedload(UserAlert.keyword),
+                joinedload(UserAlert.source),
             )
             .limit(limit)
         )
         result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.unique().scalars().all())
+
+    async def _resolve_channel(self, channel_id: int) -> Channel:
+        """Get a channel from the cache, the bot's state, or the Discord API."""
+        channel = self._channel_cache.get(channel_id)
+        if channel is None:
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                channel = await self.bot.fetch_channel(channel_id)
+            self._channel_cache[channel_id] = channel
+        return channel
+
+    def _excerpt(self, item: HNItem, limit: int) -> str:
+        """Get an item's text truncated to limit characters, memoized per item."""
+        key = (item.id, limit)
+        excerpt = self._excerpts.get(key)
+        if excerpt is None:
+            text = item.text or ""
+            excerpt = text[:limit] + "..." if len(text) > limit else text
+            self._excerpts[key] = excerpt
+        return excerpt
+
+    async def prefetch_source_threads(self, alerts: list[UserAlert]) -> None:
+        """Load existing source threads for a batch of alerts into the cache."""
+        user_ids = {alert.user_id for alert in alerts}
+        source_ids = {alert.source_id for alert in alerts}
+        if not user_ids:
+            return
+
+        result = await self.session.execute(
+            select(SourceThread.user_id, SourceThread.source_id, SourceThread.thread_id).where(
+                SourceThread.user_id.in_(user_ids),
+                SourceThread.source_id.in_(source_ids),
+            )
+        )
+        for user_id, source_id, thread_id in result:
+            self._thread_cache[(user_id, source_id)] = thread_id
 
     async def get_or_create_source_thread(
         self,
@@ -78,22 +190,42 @@ class AlertNotifier:
 
         Returns the thread ID or None if creation failed.
         """
+        cache_key = (user.id, source.id)
+        cached = self._thread_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        async with self._thread_locks[cache_key]:
+            return await self._lookup_or_create_thread(user, source, cache_key)
+
+    async def _lookup_or_create_thread(
+        self,
+        user: DiscordUser,
+        source: ContentSource,
+        cache_key: tuple[int, int],
+    ) -> str | None:
+        """Find or create the source thread while holding its pair lock."""
+        # Another alert may have created it while we waited for the lock
+        cached = self._thread_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Check if thread exists
-        stmt = select(SourceThread).where(
+        stmt = select(SourceThread.thread_id).where(
             SourceThread.user_id == user.id,
             SourceThread.source_id == source.id,
         )
-        result = await self.session.execute(stmt)
-        existing = result.scalar_one_or_none()
+        async with self._db_lock:
+            result = await self.session.execute(stmt)
+        existing = result.scalars().first()
 
         if existing:
-            return existing.thread_id
+            self._thread_cache[cache_key] = existing
+            return existing
 
         # Create thread in user's channel
         try:
-            channel = self.bot.get_channel(int(user.channel_id))
-            if channel is None:
-                channel = await self.bot.fetch_channel(int(user.channel_id))
+            channel = await self._resolve_channel(int(user.channel_id))
 
             if not isinstance(channel, discord.TextChannel):
                 logger.error("User channel %s is not a text channel", user.channel_id)
@@ -106,13 +238,12 @@ class AlertNotifier:
             )
 
             # Save to database
-            source_thread = SourceThread(
-                user_id=user.id,
-                source_id=source.id,
-                thread_id=str(thread.id),
-            )
-            self.session.add(source_thread)
-            await self.session.flush()
+            async with self._db_lock:
+                await self.session.execute(
+                    dialect_insert(self.session, SourceThread)
+                    .values(user_id=user.id, source_id=source.id, thread_id=str(thread.id))
+                    .on_conflict_do_nothing(index_elements=["source_id", "thread_id"])
+                )
 
             logger.info(
                 "Created thread %s for user %s source %s",
@@ -120,6 +251,7 @@ class AlertNotifier:
                 user.discord_username,
                 source.name,
             )
+            self._thread_cache[cache_key] = str(thread.id)
             return str(thread.id)
 
         except discord.DiscordException as e:
@@ -128,96 +260,125 @@ class AlertNotifier:
 
     def get_user_api_key(self, user: DiscordUser) -> str | None:
         """Get decrypted API key for user, or None if not set."""
-        if not user.openrouter_api_key:
+        ciphertext = user.openrouter_api_key
+        if not ciphertext:
             return None
+        cached = self._key_cache.get(ciphertext)
+        if cached is not None:
+            return cached
         try:
-            return decrypt(user.openrouter_api_key)
+            api_key = decrypt(ciphertext)
         except Exception as e:
             logger.warning("Failed to decrypt API key for user %s: %s", user.id, e)
             return None
+        self._key_cache[ciphertext] = api_key
+        return api_key
 
     async def generate_summary(
         self,
         item: HNItem,
         api_key: str | None = None,
+        use_cache: bool = True,
     ) -> str | None:
         """Generate AI summary for an HN item.
 
+        Summaries are cached by prompt, so an item matched by several users
+        is only summarized once.
+
         Args:
             item: The HN item to summarize
             api_key: User's API key (uses default if None)
+            use_cache: Whether to return a cached summary; a fresh one is
+                always cached
 
         Returns:
             Summary text or None if generation failed
         """
         # Use user's key or fall back to default
-        key = api_key or settings.openrouter_api_key
+        key = api_key or get_settings().openrouter_api_key
         if not key:
             logger.warning("No API key available for summary generation")
             return None
 
         try:
-            client = OpenRouterClient(api_key=key)
-
             # Build content to summarize
             content_parts = []
             if item.title:
                 content_parts.append(f"Title: {item.title}")
             if item.text:
-                # Truncate long text
-                text = item.text[:1000] + "..." if len(item.text) > 1000 else item.text
+                text = self._excerpt(item, SUMMARY_EXCERPT_CHARS)
                 content_parts.append(f"Content: {text}")
             if item.url:
                 content_parts.append(f"URL: {item.url}")
 
             content = "\n".join(content_parts)
 
-            messages = [
-                ChatMessage(role="system", content=SUMMARY_SYSTEM_PROMPT),
-                ChatMessage(role="user", content=content),
-            ]
+            client = self._get_ai_client(key)
+            cache_key = hashlib.sha256(f"{client.model}\0{content}".encode()).digest()
+            if use_cache:
+                cached = _summary_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            messages = [_SYSTEM_MSG, ChatMessage(role="user", content=content)]
 
             response = await client.chat(messages, max_tokens=150)
-            return response.content.strip()
+            summary = response.content.strip()
+            if summary:
+                _summary_cache[cache_key] = summary
+            return summary
 
         except OpenRouterError as e:
             logger.error("Failed to generate summary: %s", e)
             return None
 
-    def build_alert_embed(
-        self,
-        alert: UserAlert,
-        summary: str | None,
-    ) -> discord.Embed:
-        """Build a Discord embed for an alert."""
+    def _embed_input(self, alert: UserAlert) -> _EmbedInput:
+        """Extract the fields needed to render an alert's embed."""
         item = alert.item
-        keyword = alert.keyword
 
         # Color based on item type
         color = discord.Color.orange() if item.item_type == "story" else discord.Color.blue()
 
-        embed = discord.Embed(
+        meta_parts = [f"by {item.author}"]
+        if item.score:
+            meta_parts.append(f"{item.score} points")
+
+        return _EmbedInput(
             title=item.title or "Comment",
             url=item.hn_url,
             color=color,
+            author_name=f"🔔 Keyword: {alert.keyword.phrase}",
+            meta=" · ".join(meta_parts),
+            text=self._excerpt(item, DISPLAY_EXCERPT_CHARS) if item.text else None,
         )
 
+    def prefetch_embed_inputs(self, alerts: list[UserAlert]) -> None:
+        """Extract embed fields for a batch of alerts while they are freshly loaded."""
+        for alert in alerts:
+            self._embed_inputs[alert.id] = self._embed_input(alert)
+
+    def build_alert_embed(
+        self,
+        alert: UserAlert,
+        summary: str | None,
+    ) -> discord.Embed:
+        """Build a Discord embed for an alert."""
+        fields = self._embed_inputs.pop(alert.id, None) or self._embed_input(alert)
+
+        embed = discord.Embed(title=fields.title, url=fields.url, color=fields.color)
+
         # Add keyword match info
-        embed.set_author(name=f"🔔 Keyword: {keyword.phrase}")
+        embed.set_author(name=fields.author_name)
 
         # Add metadata
-        meta_parts = [f"by {item.author}"]
-        if item.score:
-            meta_parts.append(f"{item.score} points")
-        embed.add_field(name="Info", value=" · ".join(meta_parts), inline=False)
+        embed.add_field(name="Info", value=fields.meta, inline=False)
 
         # Add summary or fallback
         if summary:
             embed.add_field(name="AI Summary", value=summary, inline=False)
-        elif item.text:
+        elif fields.text:
             # Show truncated text as fallback
-            text = item.text[:300] + "..." if len(item.text) > 300 else item.text
-            embed.add_field(name="Content", value=text, inline=False)
+            embed.add_field(name="Content", value=fields.text, inline=False)
 
         embed.set_footer(text="Hacker News")
 
@@ -231,6 +392,9 @@ class AlertNotifier:
     async def send_alert(self, alert: UserAlert) -> bool:
         """Send a single alert to Discord.
 
+        The alert's new status is queued and written by
+        process_pending_alerts() once the whole batch has been sent.
+
         Returns True if successful.
         """
         user = alert.user
@@ -244,9 +408,7 @@ class AlertNotifier:
             return False
 
         try:
-            thread = self.bot.get_channel(int(thread_id))
-            if thread is None:
-                thread = await self.bot.fetch_channel(int(thread_id))
+            thread = await self._resolve_channel(int(thread_id))
 
             if not isinstance(thread, discord.Thread):
                 logger.error("Channel %s is not a thread", thread_id)
@@ -256,9 +418,6 @@ class AlertNotifier:
             api_key = self.get_user_api_key(user)
             summary = await self.generate_summary(item, api_key)
 
-            # Save summary to alert
-            alert.summary = summary
-
             # Build message
             embed = self.build_alert_embed(alert, summary)
             view = self.build_alert_view(alert.id)
@@ -266,10 +425,14 @@ class AlertNotifier:
             # Send message
             message = await thread.send(embed=embed, view=view)
 
-            # Update alert status
-            alert.status = AlertStatus.SENT.value
-            alert.discord_message_id = str(message.id)
-            await self.session.flush()
+            self._sent_updates.append(
+                {
+                    "id": alert.id,
+                    "status": AlertStatus.SENT.value,
+                    "summary": summary,
+                    "discord_message_id": str(message.id),
+                }
+            )
 
             logger.info("Sent alert %d to thread %s", alert.id, thread_id)
             return True
@@ -278,38 +441,48 @@ class AlertNotifier:
             logger.error("Failed to send alert %d: %s", alert.id, e)
             return False
 
-    async def process_pending_alerts(self, limit: int = 50) -> NotifyResult:
+    async def process_pending_alerts(
+        self, limit: int = 50, concurrency: int = NOTIFY_CONCURRENCY
+    ) -> NotifyResult:
         """Process pending alerts.
 
         Args:
             limit: Maximum alerts to process
+            concurrency: Maximum alerts being sent at once
 
         Returns:
             NotifyResult with statistics
         """
         alerts = await self.get_pending_alerts(limit)
         logger.info("Processing %d pending alerts", len(alerts))
+        await self.prefetch_source_threads(alerts)
+        self.prefetch_embed_inputs(alerts)
 
-        sent = 0
-        failed = 0
-
-        for alert in alerts:
-            try:
-                success = await self.send_alert(alert)
-                if success:
-                    sent += 1
-                else:
-                    failed += 1
-            except Exception as e:
-                logger.exception("Error processing alert %d: %s", alert.id, e)
-                failed += 1
+        semaphore = asyncio.Semaphore(concurrency)
 
+        async def guarded_send(alert: UserAlert) -> bool:
+            async with semaphore:
+                try:
+                    return await self.send_alert(alert)
+                except Exception as e:
+                    logger.exception("Error processing alert %d: %s", alert.id, e)
+                    return False
+
+        results = await asyncio.gather(*(guarded_send(alert) for alert in alerts))
+        sent = sum(results)
+        # Alerts that failed before rendering leave their fields behind
+        self._embed_inputs.clear()
+
+        if self._sent_updates:
+            # Bulk UPDATE by primary key, issued as a single executemany
+            await self.session.execute(update(UserAlert), self._sent_updates)
+            self._sent_updates = []
         await self.session.commit()
 
         return NotifyResult(
             alerts_processed=len(alerts),
             alerts_sent=sent,
-            alerts_failed=failed,
+            alerts_failed=len(alerts) - sent,
         )
 
 
@@ -338,17 +511,15 @@ class AlertButtonView(discord.ui.View):
 
         async with async_session_maker() as session:
             # Get alert with related data
-            stmt = (
-                select(UserAlert)
-                .where(UserAlert.id == self.alert_id)
-                .options(
-                    selectinload(UserAlert.user),
-                    selectinload(UserAlert.item),
-                    selectinload(UserAlert.keyword),
-                )
+            alert = await session.get(
+                UserAlert,
+                self.alert_id,
+                options=[
+                    joinedload(UserAlert.user),
+                    joinedload(UserAlert.item),
+                    joinedload(UserAlert.keyword),
+                ],
             )
-            result = await session.execute(stmt)
-            alert = result.scalar_one_or_none()
 
             if not alert:
                 await interaction.followup.send("Alert not found.", ephemeral=True)
@@ -364,7 +535,10 @@ class AlertButtonView(discord.ui.View):
 
             # Generate new summary
             notifier = AlertNotifier(session, interaction.client)
-            summary = await notifier.generate_summary(alert.item, api_key)
+            try:
+                summary = await notifier.generate_summary(alert.item, api_key, use_cache=False)
+            finally:
+                await notifier.aclose()
 
             if summary:
                 alert.summary = summary
@@ -389,9 +563,7 @@ class AlertButtonView(discord.ui.View):
         from community_scout.database import async_session_maker
 
         async with async_session_maker() as session:
-            stmt = select(UserAlert).where(UserAlert.id == self.alert_id)
-            result = await session.execute(stmt)
-            alert = result.scalar_one_or_none()
+            alert = await session.get(UserAlert, self.alert_id)
 
             if alert:
                 alert.status = AlertStatus.DISMISSED.value
@@ -10,14 +10,13 @@ import sys
 
 import discord
 
-from community_scout.config import settings
+from community_scout.ai.client import close_shared_client
+from community_scout.config import get_settings
 from community_scout.database import async_session_maker
+from community_scout.logging_setup import configure_queue_logging
 from community_scout.notifier.alert_notifier import AlertButtonView, AlertNotifier
+from community_scout.runtime import run
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 # How often to check for pending alerts (seconds)
@@ -30,7 +29,7 @@ class NotifierBot(discord.Client):
     def __init__(self) -> None:
         intents = discord.Intents.default()
         super().__init__(intents=intents)
-        self._shutdown = False
+        self._shutdown = asyncio.Event()
         self._ready = asyncio.Event()
 
     async def on_ready(self) -> None:
@@ -39,23 +38,36 @@ class NotifierBot(discord.Client):
         self.add_view(AlertButtonView(alert_id=0))  # Template for persistent buttons
         self._ready.set()
 
-    async def wait_until_ready_custom(self) -> None:
-        """Wait until the bot is ready."""
-        await self._ready.wait()
+    async def wait_until_ready_custom(self) -> bool:
+        """Wait until the bot is ready or shutdown is requested.
+
+        Returns:
+            True if the bot became ready
+        """
+        ready = asyncio.create_task(self._ready.wait())
+        shutdown = asyncio.create_task(self._shutdown.wait())
+        await asyncio.wait({ready, shutdown}, return_when=asyncio.FIRST_COMPLETED)
+        ready.cancel()
+        shutdown.cancel()
+        return self._ready.is_set()
 
     def request_shutdown(self) -> None:
-        self._shutdown = True
+        self._shutdown.set()
 
     async def run_notifier_loop(self) -> None:
-        """Run the notification loop."""
-        await self.wait_until_ready_custom()
+        """Run the notification loop until shutdown is requested."""
+        if not await self.wait_until_ready_custom():
+            return
         logger.info("Starting notifier loop (interval: %ds)", NOTIFY_INTERVAL_SECONDS)
 
-        while not self._shutdown:
+        while not self._shutdown.is_set():
             try:
                 async with async_session_maker() as session:
                     notifier = AlertNotifier(session, self)
-                    result = await notifier.process_pending_alerts()
+                    try:
+                        result = await notifier.process_pending_alerts()
+                    finally:
+                        await notifier.aclose()
 
                     if result.alerts_processed > 0:
                         logger.info(
@@ -67,53 +79,62 @@ class NotifierBot(discord.Client):
             except Exception:
                 logger.exception("Error in notifier loop")
 
-            # Wait for next interval
-            for _ in range(NOTIFY_INTERVAL_SECONDS):
-                if self._shutdown:
-                    break
-                await asyncio.sleep(1)
+            # Wait for next interval, waking early on shutdown
+            try:
+                await asyncio.wait_for(self._shutdown.wait(), NOTIFY_INTERVAL_SECONDS)
+            except TimeoutError:
+                pass
 
         logger.info("Notifier loop stopped")
 
 
 async def main() -> None:
     """Main entry point."""
-    if not settings.discord_bot_token:
+    if not get_settings().discord_bot_token:
         logger.error("DISCORD_BOT_TOKEN not configured")
         sys.exit(1)
 
     bot = NotifierBot()
 
-    # Set up signal handlers
+    # Set up signal handlers; the notifier loop wakes on the shutdown event,
+    # finishes its current batch and then closes the bot
     loop = asyncio.get_running_loop()
 
     def signal_handler() -> None:
         logger.info("Shutdown signal received")
         bot.request_shutdown()
-        # Schedule close after a short delay to allow cleanup
-        loop.create_task(shutdown(bot))
-
-    async def shutdown(bot: NotifierBot) -> None:
-        await asyncio.sleep(1)
-        await bot.close()
 
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, signal_handler)
 
-    # Start the bot and notifier loop
-    async with bot:
-        bot_task = asyncio.create_task(bot.start(settings.discord_bot_token))
-        notifier_task = asyncio.create_task(bot.run_notifier_loop())
+    async def run_bot() -> None:
+        try:
+            await bot.start(get_settings().discord_bot_token)
+        finally:
+            # Stop notifying if the connection ends for any reason
+            bot.request_shutdown()
 
+    async def run_notifier() -> None:
         try:
-            await asyncio.gather(bot_task, notifier_task)
-        except asyncio.CancelledError:
-            logger.info("Tasks cancelled")
+            await bot.run_notifier_loop()
+        finally:
+            await bot.close()
+
+    # Start the bot and notifier loop; a failure in either cancels the other
+    try:
+        async with bot, asyncio.TaskGroup() as tg:
+            tg.create_task(run_bot())
+            tg.create_task(run_notifier())
+    finally:
+        await close_shared_client()
 
 
 if __name__ == "__main__":
+    listener = configure_queue_logging()
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         logger.info("Interrupted")
         sys.exit(0)
+    finally:
+        listener.stop()
@@ -0,0 +1,21 @@
+"""Event loop runtime helpers."""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on uvloop when it is installed.
+
+    Falls back to the default asyncio event loop otherwise (e.g. on Windows).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
@@ -2,20 +2,28 @@
 
 from community_scout.scanner.hn_scanner import (
     HNScanner,
+    KeywordMatcher,
     ScanResult,
+    bulk_insert_alerts,
+    bulk_upsert_hn_items,
     match_keywords,
 )
 from community_scout.scanner.run import ScannerRunner
 from community_scout.scanner.state import (
+    advance_scanner_state,
     get_scanner_state,
     update_scanner_state,
 )
 
 __all__ = [
     "HNScanner",
+    "KeywordMatcher",
     "ScanResult",
     "ScannerRunner",
+    "bulk_insert_alerts",
+    "bulk_upsert_hn_items",
     "match_keywords",
+    "advance_scanner_state",
     "get_scanner_state",
     "update_scanner_state",
 ]
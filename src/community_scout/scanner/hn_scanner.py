@@ -1,12 +1,16 @@
 """Hacker News scanner service."""
 
+import asyncio
+import functools
 import logging
 import re
 from dataclasses import dataclass
+from typing import Any
 
-from sqlalchemy import and_, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from community_scout.database import dialect_insert
 from community_scout.hn.client import HNClient, HNItemData
 from community_scout.models import (
     AlertStatus,
@@ -15,12 +19,25 @@ from community_scout.models import (
     UserAlert,
     UserKeyword,
 )
-from community_scout.scanner.state import get_scanner_state, update_scanner_state
+from community_scout.scanner.state import advance_scanner_state, get_scanner_state
 
 logger = logging.getLogger(__name__)
 
 SOURCE_NAME = "hackernews"
 BATCH_SIZE = 50
+INSERT_BATCH_SIZE = 1000  # Max rows per multi-row INSERT
+STATE_COMMIT_BATCHES = 10  # Batches between commits when catching up
+
+KeywordMap = dict[str, list[tuple[int, int]]]
+
+# HNScanner is rebuilt for every scan, so these outlive a single instance.
+# The hackernews source row never changes once it exists.
+_content_source_cache: ContentSource | None = None
+# Active keywords, keyed on (count, max id) of the active rows. Keywords are
+# only ever inserted or deactivated, so any change moves one of the two.
+_keyword_cache: tuple[tuple[int, int | None], KeywordMap] | None = None
+# Matcher compiled for the cached keyword map (or the last map seen by match_item)
+_matcher_cache: tuple[KeywordMap, "KeywordMatcher"] | None = None
 
 
 @dataclass
@@ -33,6 +50,83 @@ class ScanResult:
     last_seen_id: int
 
 
+class KeywordMatcher:
+    """Matches text against a fixed keyword list with precompiled patterns.
+
+    Single words are matched with word boundaries and phrases (containing
+    spaces) as substrings, each kind in one scan of the text. The patterns
+    are lookaheads, so matches may overlap; a keyword that is a prefix of
+    another of the same kind can be hidden by it at a shared start, so those
+    few are also checked on their own.
+    """
+
+    __slots__ = (
+        "_originals",
+        "_order",
+        "_word_re",
+        "_phrase_re",
+        "_shadowed_words",
+        "_shadowed_phrases",
+    )
+
+    def __init__(self, keywords: list[str]) -> None:
+        """Compile patterns for the given keywords/phrases."""
+        # Lowercased once here; matches come back lowercased from the patterns
+        self._originals: dict[str, list[str]] = {}
+        for keyword in keywords:
+            self._originals.setdefault(keyword.lower(), []).append(keyword)
+        self._order = {lower: index for index, lower in enumerate(self._originals)}
+        words = {lower for lower in self._originals if " " not in lower}
+        phrases = {lower for lower in self._originals if " " in lower}
+
+        self._word_re = self._compile(words, r"\b(", r")\b")
+        self._phrase_re = self._compile(phrases, "(", ")")
+        self._shadowed_words = {
+            word: re.compile(rf"\b{re.escape(word)}\b")
+            for word in words
+            if any(other != word and other.startswith(word) for other in words)
+        }
+        self._shadowed_phrases = [
+            phrase
+            for phrase in phrases
+            if any(other != phrase and other.startswith(phrase) for other in phrases)
+        ]
+
+    @staticmethod
+    def _compile(keywords: set[str], prefix: str, suffix: str) -> re.Pattern[str] | None:
+        if not keywords:
+            return None
+        # Longest first, so a shorter prefix doesn't win the alternation
+        alternation = "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+        return re.compile(f"(?={prefix}{alternation}{suffix})")
+
+    def match(self, text: str | None) -> list[str]:
+        """Return the keywords found in text, in keyword order."""
+        if not text:
+            return []
+
+        text_lower = text.lower()
+        found: set[str] = set()
+        if self._word_re is not None:
+            found.update(m.group(1) for m in self._word_re.finditer(text_lower))
+            for word, pattern in self._shadowed_words.items():
+                if word not in found and pattern.search(text_lower):
+                    found.add(word)
+        if self._phrase_re is not None:
+            found.update(m.group(1) for m in self._phrase_re.finditer(text_lower))
+            for phrase in self._shadowed_phrases:
+                if phrase not in found and phrase in text_lower:
+                    found.add(phrase)
+
+        if not found:
+            return []
+        return [
+            keyword
+            for lower in sorted(found, key=self._order.__getitem__)
+            for keyword in self._originals[lower]
+        ]
+
+
 def match_keywords(text: str | None, keywords: list[str]) -> list[str]:
     """Match keywords against text.
 
@@ -46,25 +140,82 @@ def match_keywords(text: str | None, keywords: list[str]) -> list[str]:
     Returns:
         List of matched keywords
     """
-    if not text:
-        return []
-
-    text_lower = text.lower()
-    matches: list[str] = []
-
-    for keyword in keywords:
-        keyword_lower = keyword.lower()
-        if " " in keyword:
-            # Phrase: use substring match
-            if keyword_lower in text_lower:
-                matches.append(keyword)
-        else:
-            # Single word: use word boundary
-            pattern = rf"\b{re.escape(keyword_lower)}\b"
-            if re.search(pattern, text_lower):
-                matches.append(keyword)
+    return _cached_matcher(tuple(keywords)).match(text)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_matcher(keywords: tuple[str, ...]) -> KeywordMatcher:
+    """Get a compiled matcher for an ad-hoc keyword list, reused across calls."""
+    return KeywordMatcher(list(keywords))
+
+
+def hn_item_row(item: HNItemData) -> dict[str, Any]:
+    """Convert API item data into an hn_items row."""
+    return {
+        "hn_id": item.id,
+        "item_type": item.item_type,
+        "title": item.title,
+        "text": item.text,
+        "url": item.url,
+        "author": item.author,
+        "score": item.score,
+        "parent_id": item.parent_id,
+        "created_utc": item.created_utc,
+    }
+
+
+async def bulk_upsert_hn_items(
+    session: AsyncSession, rows: list[dict[str, Any]]
+) -> dict[int, int]:
+    """Insert HN item rows in batches, skipping items that already exist.
+
+    Args:
+        session: Database session
+        rows: Rows as produced by hn_item_row
+
+    Returns:
+        Dict mapping HN item ID to row ID for the rows actually inserted
+    """
+    inserted: dict[int, int] = {}
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        batch = rows[start : start + INSERT_BATCH_SIZE]
+        stmt = (
+            dialect_insert(session, HNItem)
+            .values(batch)
+            .on_conflict_do_nothing(index_elements=["hn_id"])
+            .returning(HNItem.hn_id, HNItem.id)
+        )
+        result = await session.execute(stmt)
+        for hn_id, row_id in result:
+            inserted[hn_id] = row_id
+    return inserted
+
+
+async def bulk_insert_alerts(
+    session: AsyncSession, rows: list[dict[str, Any]]
+) -> list[tuple[int, int, int]]:
+    """Insert user alert rows in batches, skipping alerts that already exist.
+
+    Args:
+        session: Database session
+        rows: user_alerts rows (user_id, item_id, keyword_id, source_id, status)
 
-    return matches
+    Returns:
+        (user_id, item_id, keyword_id) of the alerts actually inserted
+    """
+    created: list[tuple[int, int, int]] = []
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        batch = rows[start : start + INSERT_BATCH_SIZE]
+        # Duplicates are rejected by the (user_id, item_id, keyword_id) unique index
+        stmt = (
+            dialect_insert(session, UserAlert)
+            .values(batch)
+            .on_conflict_do_nothing(index_elements=["user_id", "item_id", "keyword_id"])
+            .returning(UserAlert.user_id, UserAlert.item_id, UserAlert.keyword_id)
+        )
+        result = await session.execute(stmt)
+        created.extend(result.all())
+    return created
 
 
 def get_searchable_text(item: HNItemData) -> str:
@@ -79,14 +230,8 @@ def get_searchable_text(item: HNItemData) -> str:
     Returns:
         Combined searchable text
     """
-    parts: list[str] = []
-    if item.title:
-        parts.append(item.title)
-    if item.text:
-        parts.append(item.text)
-    if item.url:
-        parts.append(item.url)
-    return " ".join(parts)
+    # Comments have no title or url; filter drops them along with empty strings
+    return " ".join(filter(None, (item.title, item.text, item.url)))
 
 
 class HNScanner:
@@ -105,38 +250,65 @@ class HNScanner:
 
     async def get_content_source(self) -> ContentSource:
         """Get or create the hackernews content source."""
+        global _content_source_cache
         if self._content_source is not None:
             return self._content_source
 
+        if _content_source_cache is not None:
+            # Attach the cached row to this session without querying it again
+            cached = await self.session.merge(_content_source_cache, load=False)
+            self._content_source = cached
+            return cached
+
         stmt = select(ContentSource).where(ContentSource.name == SOURCE_NAME)
         result = await self.session.execute(stmt)
         source = result.scalar_one_or_none()
 
         if source is None:
+            # Not cached process-wide until committed, as it may be rolled back
             source = ContentSource(name=SOURCE_NAME, is_active=True)
             self.session.add(source)
             await self.session.flush()
+        else:
+            _content_source_cache = source
 
         self._content_source = source
         return source
 
-    async def get_active_keywords(self) -> dict[str, list[tuple[int, int]]]:
+    async def get_active_keywords(self) -> KeywordMap:
         """Get all active keywords grouped by phrase.
 
+        The map is cached across scans and only rebuilt when the set of
+        active keywords has changed.
+
         Returns:
             Dict mapping keyword phrase to list of (keyword_id, user_id) tuples
         """
-        stmt = select(UserKeyword).where(UserKeyword.is_active == True)  # noqa: E712
-        result = await self.session.execute(stmt)
-        keywords = result.scalars().all()
+        global _keyword_cache, _matcher_cache
+        is_active = UserKeyword.is_active == True  # noqa: E712
+        count, max_id = (
+            await self.session.execute(
+                select(func.count(UserKeyword.id), func.max(UserKeyword.id)).where(is_active)
+            )
+        ).one()
+        version = (count, max_id)
+        if _keyword_cache is not None and _keyword_cache[0] == version:
+            return _keyword_cache[1]
+
+        result = await self.session.execute(
+            select(UserKeyword.phrase, UserKeyword.id, UserKeyword.user_id).where(is_active)
+        )
 
-        keyword_map: dict[str, list[tuple[int, int]]] = {}
-        for kw in keywords:
-            phrase = kw.phrase.lower()
+        keyword_map: KeywordMap = {}
+        for phrase, keyword_id, user_id in result:
+            phrase = phrase.lower()
             if phrase not in keyword_map:
                 keyword_map[phrase] = []
-            keyword_map[phrase].append((kw.id, kw.user_id))
+            keyword_map[phrase].append((keyword_id, user_id))
 
+        # Compile the matcher with the map, so it lives exactly as long as it
+        _keyword_cache = (version, keyword_map)
+        _matcher_cache = (keyword_map, KeywordMatcher(list(keyword_map)))
         return keyword_map
 
     async def store_item(self, item: HNItemData) -> HNItem:
@@ -148,42 +320,64 @@ class HNScanner:
         Returns:
             Stored HNItem model
         """
-        # Check if item already exists
-        stmt = select(HNItem).where(HNItem.hn_id == item.id)
+        stored = await self.store_items([item])
+        return stored[item.id]
+
+    async def store_items(self, items: list[HNItemData]) -> dict[int, HNItem]:
+        """Store HN items in bulk, keeping any rows that already exist.
+
+        Args:
+            items: Item data from API
+
+        Returns:
+            Dict mapping HN item ID to the stored HNItem model
+        """
+        if not items:
+            return {}
+
+        await bulk_upsert_hn_items(self.session, [hn_item_row(item) for item in items])
+
+        stmt = select(HNItem).where(HNItem.hn_id.in_([item.id for item in items]))
         result = await self.session.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if existing is not None:
-            return existing
-
-        hn_item = HNItem(
-            hn_id=item.id,
-            item_type=item.item_type,
-            title=item.title,
-            text=item.text,
-            url=item.url,
-            author=item.author,
-            score=item.score,
-            parent_id=item.parent_id,
-            created_utc=item.created_at,
-        )
-        self.session.add(hn_item)
-        await self.session.flush()
-        return hn_item
-
-    async def alert_exists(
-        self, user_id: int, item_id: int, keyword_id: int
-    ) -> bool:
-        """Check if an alert already exists for this user/item/keyword combo."""
-        stmt = select(UserAlert).where(
-            and_(
-                UserAlert.user_id == user_id,
-                UserAlert.item_id == item_id,
-                UserAlert.keyword_id == keyword_id,
+        return {hn_item.hn_id: hn_item for hn_item in result.scalars()}
+
+    async def store_item_ids(self, items: list[HNItemData]) -> tuple[dict[int, int], list[int]]:
+        """Store HN items in bulk and return their row IDs without loading rows.
+
+        Args:
+            items: Item data from API
+
+        Returns:
+            Tuple of (dict mapping HN item ID to hn_items row ID, row IDs of
+            the items that were already stored)
+        """
+        if not items:
+            return {}, []
+
+        ids = await bulk_upsert_hn_items(self.session, [hn_item_row(item) for item in items])
+
+        # Items that already existed were skipped by the insert
+        missing = [item.id for item in items if item.id not in ids]
+        existing: list[int] = []
+        if missing:
+            result = await self.session.execute(
+                select(HNItem.hn_id, HNItem.id).where(HNItem.hn_id.in_(missing))
+            )
+            for hn_id, row_id in result:
+                ids[hn_id] = row_id
+                existing.append(row_id)
+        return ids, existing
+
+    async def get_existing_alerts(self, item_ids: list[int]) -> set[tuple[int, int, int]]:
+        """Get the (user_id, item_id, keyword_id) of alerts for the given items."""
+        if not item_ids:
+            return set()
+        result = await self.session.execute(
+            select(UserAlert.user_id, UserAlert.item_id, UserAlert.keyword_id).where(
+                UserAlert.item_id.in_(item_ids)
             )
         )
-        result = await self.session.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        return {(user_id, item_id, keyword_id) for user_id, item_id, keyword_id in result}
 
     async def create_alert(
         self,
@@ -196,68 +390,98 @@ class HNScanner:
 
         Returns None if alert already exists.
         """
-        # Check for duplicate
-        if await self.alert_exists(user_id, hn_item.id, keyword_id):
-            return None
-
-        alert = UserAlert(
-            user_id=user_id,
-            item_id=hn_item.id,
-            keyword_id=keyword_id,
-            source_id=source.id,
-            status=AlertStatus.PENDING.value,
+        # Duplicates are rejected by the (user_id, item_id, keyword_id) unique index
+        stmt = (
+            dialect_insert(self.session, UserAlert)
+            .values(
+                user_id=user_id,
+                item_id=hn_item.id,
+                keyword_id=keyword_id,
+                source_id=source.id,
+                status=AlertStatus.PENDING.value,
+            )
+            .on_conflict_do_nothing(index_elements=["user_id", "item_id", "keyword_id"])
+            .returning(UserAlert)
         )
-        self.session.add(alert)
-        await self.session.flush()
-        return alert
+        result = await self.session.scalars(stmt)
+        return result.one_or_none()
 
-    async def process_item(
+    def match_item(self, item: HNItemData, keyword_map: KeywordMap) -> list[str]:
+        """Match an item's searchable text against the active keywords."""
+        global _matcher_cache
+        text = get_searchable_text(item)
+        if not text:
+            return []
+        if _matcher_cache is None or _matcher_cache[0] is not keyword_map:
+            _matcher_cache = (keyword_map, KeywordMatcher(list(keyword_map)))
+        return _matcher_cache[1].match(text)
+
+    def match_items(
+        self, items: list[HNItemData], keyword_map: KeywordMap
+    ) -> list[tuple[HNItemData, list[str]]]:
+        """Match a batch of items, keeping only those with at least one match."""
+        matched: list[tuple[HNItemData, list[str]]] = []
+        for item in items:
+            matched_keywords = self.match_item(item, keyword_map)
+            if matched_keywords:
+                matched.append((item, matched_keywords))
+        return matched
+
+    async def process_batch(
         self,
-        item: HNItemData,
-        keyword_map: dict[str, list[tuple[int, int]]],
+        items: list[HNItemData],
+        keyword_map: KeywordMap,
         source: ContentSource,
-    ) -> tuple[bool, int]:
-        """Process a single item: only store if it matches keywords.
+    ) -> tuple[int, int]:
+        """Process a batch of items: only store those that match keywords.
+
+        Matching runs first for the whole batch, in a worker thread so the
+        event loop keeps serving the next batch's fetch meanwhile. Matched
+        items, and then their alerts, are stored with one bulk insert each.
 
         Args:
-            item: HN item data
+            items: HN item data
             keyword_map: Mapping of keyword phrases to (keyword_id, user_id) tuples
             source: Content source record
 
         Returns:
-            Tuple of (was_stored, alerts_created)
+            Tuple of (items_stored, alerts_created)
         """
-        # Get searchable text
-        text = get_searchable_text(item)
-        if not text:
-            return False, 0
-
-        # Match keywords FIRST
-        all_keywords = list(keyword_map.keys())
-        matched_keywords = match_keywords(text, all_keywords)
-
-        # Only store if there's at least one match
-        if not matched_keywords:
-            return False, 0
-
-        # Store the item (only matched items)
-        hn_item = await self.store_item(item)
-
-        alerts_created = 0
-        for matched_keyword in matched_keywords:
-            # Create alert for each user monitoring this keyword
-            for keyword_id, user_id in keyword_map[matched_keyword.lower()]:
-                alert = await self.create_alert(user_id, hn_item, keyword_id, source)
-                if alert is not None:
-                    alerts_created += 1
-                    logger.info(
-                        "Alert created: user=%d keyword=%s item=%d",
-                        user_id,
-                        matched_keyword,
-                        item.id,
+        matched = await asyncio.to_thread(self.match_items, items, keyword_map)
+        if not matched:
+            return 0, 0
+
+        item_ids, existing_item_ids = await self.store_item_ids([item for item, _ in matched])
+        # Only items stored by an earlier batch can already have alerts; the
+        # unique index still rejects any that race in after this check
+        existing_alerts = await self.get_existing_alerts(existing_item_ids)
+
+        # One alert row per user monitoring each matched keyword
+        alert_rows: list[dict[str, Any]] = []
+        for item, matched_keywords in matched:
+            item_id = item_ids[item.id]
+            for matched_keyword in matched_keywords:
+                for keyword_id, user_id in keyword_map[matched_keyword]:
+                    if (user_id, item_id, keyword_id) in existing_alerts:
+                        continue
+                    alert_rows.append(
+                        {
+                            "user_id": user_id,
+                            "item_id": item_id,
+                            "keyword_id": keyword_id,
+                            "source_id": source.id,
+                            "status": AlertStatus.PENDING.value,
+                        }
                     )
 
-        return True, alerts_created
+        created = await bulk_insert_alerts(self.session, alert_rows)
+        alerts_created = len(created)
+        for user_id, item_id, keyword_id in created:
+            logger.info(
+                "Alert created: user=%d keyword_id=%d item_id=%d", user_id, keyword_id, item_id
+            )
+
+        return len(matched), alerts_created
 
     async def scan(self, initial_lookback: int = 100) -> ScanResult:
         """Run a scan for new HN items.
@@ -296,7 +520,8 @@ class HNScanner:
         keyword_map = await self.get_active_keywords()
         if not keyword_map:
             logger.warning("No active keywords configured, updating state only")
-            await update_scanner_state(self.session, SOURCE_NAME, max_item_id)
+            advance_scanner_state(state, max_item_id)
+            await self.session.commit()
             return ScanResult(
                 items_scanned=0,
                 items_stored=0,
@@ -318,27 +543,36 @@ class HNScanner:
         total_stored = 0
         total_alerts = 0
 
-        # Process in batches
-        current_id = start_id
-        while current_id <= max_item_id:
-            batch_end = min(current_id + BATCH_SIZE, max_item_id + 1)
-            batch_ids = list(range(current_id, batch_end))
-
-            logger.debug("Fetching batch: %d to %d", current_id, batch_end - 1)
-            items = await self.hn_client.get_items_batch(batch_ids)
-
-            for item in items:
-                was_stored, alerts = await self.process_item(item, keyword_map, source)
-                if was_stored:
-                    total_stored += 1
+        # Process in batches, fetching the next batch while the current one
+        # is written to the database
+        batches = [
+            list(range(batch_start, min(batch_start + BATCH_SIZE, max_item_id + 1)))
+            for batch_start in range(start_id, max_item_id + 1, BATCH_SIZE)
+        ]
+        logger.debug("Fetching batch: %d to %d", batches[0][0], batches[0][-1])
+        next_fetch = asyncio.create_task(self.hn_client.get_items_batch(batches[0]))
+        try:
+            for index, batch_ids in enumerate(batches):
+                items = await next_fetch
+                if index + 1 < len(batches):
+                    next_ids = batches[index + 1]
+                    logger.debug("Fetching batch: %d to %d", next_ids[0], next_ids[-1])
+                    next_fetch = asyncio.create_task(self.hn_client.get_items_batch(next_ids))
+
+                stored, alerts = await self.process_batch(items, keyword_map, source)
+                total_stored += stored
                 total_alerts += alerts
-
-            total_scanned += len(batch_ids)
-            current_id = batch_end
-
-            # Update state after each batch
-            await update_scanner_state(self.session, SOURCE_NAME, batch_end - 1)
-            await self.session.commit()
+                total_scanned += len(batch_ids)
+
+                # Inserts are idempotent, so a crash only means re-scanning the
+                # uncommitted batches; commit every few batches and at the end
+                advance_scanner_state(state, batch_ids[-1])
+                if (index + 1) % STATE_COMMIT_BATCHES == 0 or index + 1 == len(batches):
+                    await self.session.commit()
+        finally:
+            # Don't leave a prefetch running if a batch failed
+            if not next_fetch.done():
+                next_fetch.cancel()
 
         logger.info(
             "Scan complete: scanned=%d stored=%d alerts=%d",
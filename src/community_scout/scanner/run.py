@@ -4,39 +4,48 @@ Run with: python -m community_scout.scanner.run
 """
 
 import asyncio
+import contextlib
 import logging
 import signal
 import sys
 from datetime import UTC, datetime
 
-from community_scout.config import settings
-from community_scout.database import async_session_maker
-from community_scout.hn.client import HNClient
+import httpx
+
+from community_scout.config import get_settings
+from community_scout.database import async_session_maker, pool_stats
+from community_scout.hn.client import HNClient, close_shared_client
+from community_scout.logging_setup import configure_queue_logging
+from community_scout.runtime import run
 from community_scout.scanner.hn_scanner import HNScanner
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
+# Wait before reopening the HN updates stream after it drops
+STREAM_RECONNECT_SECONDS = 30
+
 
 class ScannerRunner:
     """Runs the HN scanner on a configured interval."""
 
-    def __init__(self, interval_minutes: int = 5) -> None:
+    def __init__(self, interval_minutes: int = 5, stream_updates: bool = False) -> None:
         """Initialize the runner.
 
         Args:
             interval_minutes: Minutes between scans
+            stream_updates: Also scan whenever the HN updates stream reports
+                items newer than the last scan
         """
         self.interval_minutes = interval_minutes
-        self._shutdown = False
+        self.stream_updates = stream_updates
+        self._shutdown = asyncio.Event()
+        self._new_items = asyncio.Event()
+        self._last_seen_id = 0
 
     def request_shutdown(self) -> None:
         """Request graceful shutdown."""
         logger.info("Shutdown requested")
-        self._shutdown = True
+        self._shutdown.set()
 
     async def run_once(self) -> None:
         """Run a single scan."""
@@ -47,16 +56,51 @@ class ScannerRunner:
                 scanner = HNScanner(session, hn_client)
                 try:
                     result = await scanner.scan()
+                    self._last_seen_id = result.last_seen_id
                     logger.info(
                         "Scan complete: scanned=%d stored=%d alerts=%d",
                         result.items_scanned,
                         result.items_stored,
                         result.alerts_created,
                     )
+                    logger.debug("DB pool: %s", pool_stats())
                 except Exception:
                     logger.exception("Scan failed")
                     raise
 
+    async def watch_updates(self) -> None:
+        """Flag new items reported by the HN updates stream, reconnecting as needed."""
+        async with HNClient() as hn_client:
+            while not self._shutdown.is_set():
+                try:
+                    async for item_ids in hn_client.stream_updates():
+                        if max(item_ids) > self._last_seen_id:
+                            self._new_items.set()
+                except httpx.HTTPError as e:
+                    logger.warning("HN updates stream failed: %s", e)
+                except Exception:
+                    logger.exception("HN updates stream failed unexpectedly")
+
+                try:
+                    await asyncio.wait_for(self._shutdown.wait(), STREAM_RECONNECT_SECONDS)
+                except TimeoutError:
+                    pass
+
+    async def wait_for_next_scan(self) -> None:
+        """Wait for the scan interval, new items on the stream, or shutdown."""
+        waits = [
+            asyncio.create_task(self._shutdown.wait()),
+            asyncio.create_task(self._new_items.wait()),
+        ]
+        try:
+            await asyncio.wait(
+                waits, timeout=self.interval_minutes * 60, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for wait in waits:
+                wait.cancel()
+        self._new_items.clear()
+
     async def run_loop(self) -> None:
         """Run continuous scan loop."""
         logger.info(
@@ -64,28 +108,36 @@ class ScannerRunner:
             self.interval_minutes,
         )
 
-        while not self._shutdown:
-            try:
-                await self.run_once()
-            except Exception:
-                logger.exception("Scan iteration failed, will retry next interval")
-
-            if self._shutdown:
-                break
+        watcher = asyncio.create_task(self.watch_updates()) if self.stream_updates else None
+        try:
+            while not self._shutdown.is_set():
+                try:
+                    await self.run_once()
+                except Exception:
+                    logger.exception("Scan iteration failed, will retry next interval")
 
-            # Wait for next interval
-            logger.info("Sleeping for %d minutes...", self.interval_minutes)
-            for _ in range(self.interval_minutes * 60):
-                if self._shutdown:
+                if self._shutdown.is_set():
                     break
-                await asyncio.sleep(1)
+
+                # The REST scan still runs every interval, in case the stream is down
+                logger.info("Waiting up to %d minutes for new items...", self.interval_minutes)
+                await self.wait_for_next_scan()
+        finally:
+            if watcher is not None:
+                watcher.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await watcher
 
         logger.info("Scanner stopped")
 
 
 async def main() -> None:
     """Main entry point."""
-    runner = ScannerRunner(interval_minutes=settings.hn_scan_interval_minutes)
+    settings = get_settings()
+    runner = ScannerRunner(
+        interval_minutes=settings.hn_scan_interval_minutes,
+        stream_updates=settings.hn_stream_updates,
+    )
 
     # Set up signal handlers for graceful shutdown
     loop = asyncio.get_running_loop()
@@ -96,12 +148,18 @@ async def main() -> None:
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, signal_handler)
 
-    await runner.run_loop()
+    try:
+        await runner.run_loop()
+    finally:
+        await close_shared_client()
 
 
 if __name__ == "__main__":
+    listener = configure_queue_logging()
     try:
-        asyncio.run(main())
+        run(main())
     except KeyboardInterrupt:
         logger.info("Interrupted")
         sys.exit(0)
+    finally:
+        listener.stop()
@@ -43,6 +43,18 @@ async def update_scanner_state(
         last_seen_id: Last processed item ID
     """
     state = await get_scanner_state(session, source_name)
+    advance_scanner_state(state, last_seen_id)
+    await session.flush()
+
+
+def advance_scanner_state(state: ScannerState, last_seen_id: int) -> None:
+    """Record progress on an already loaded scanner state.
+
+    The change is written with the session's next flush or commit.
+
+    Args:
+        state: Scanner state record
+        last_seen_id: Last processed item ID
+    """
     state.last_seen_id = last_seen_id
     state.last_scan_at = datetime.now(UTC)
-    await session.flush()
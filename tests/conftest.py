@@ -7,6 +7,7 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy import StaticPool
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from community_scout import database
 from community_scout.api.main import app
 from community_scout.database import get_db
 from community_scout.models import Base, ContentSource, DiscordUser, UserKeyword
@@ -60,6 +61,12 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+@pytest.fixture
+def use_test_engine(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point code that uses the module-level engine directly at the test database."""
+    monkeypatch.setattr(database, "engine", test_engine)
+
+
 @pytest.fixture
 async def client() -> AsyncGenerator[AsyncClient, None]:
     """Create async test client."""
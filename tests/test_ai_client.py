@@ -0,0 +1,264 @@
+"""Tests for the OpenRouter client."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from community_scout.ai import client as ai_client
+from community_scout.ai.client import (
+    ChatMessage,
+    OpenRouterClient,
+    OpenRouterError,
+    RateLimiter,
+    close_shared_client,
+    parse_retry_after,
+)
+
+
+class TestParseRetryAfter:
+    """Tests for Retry-After header parsing."""
+
+    def test_missing_header(self) -> None:
+        """Test that a missing header yields None."""
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+
+    def test_seconds(self) -> None:
+        """Test integer and fractional second values."""
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after("1.5") == 1.5
+
+    def test_http_date(self) -> None:
+        """Test an HTTP-date value in the future."""
+        retry_at = datetime.now(UTC) + timedelta(seconds=30)
+        seconds = parse_retry_after(format_datetime(retry_at, usegmt=True))
+        assert seconds is not None
+        assert 25 <= seconds <= 30
+
+    def test_http_date_in_past(self) -> None:
+        """Test that a past HTTP-date does not produce a negative wait."""
+        retry_at = datetime.now(UTC) - timedelta(minutes=5)
+        assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == 0.0
+
+    def test_malformed(self) -> None:
+        """Test that garbage values are ignored."""
+        assert parse_retry_after("soon") is None
+
+
+class TestBackoff:
+    """Tests for retry delay computation."""
+
+    def test_next_delay_bounds(self) -> None:
+        """Test that jittered delays stay between the base and the cap."""
+        client = OpenRouterClient(api_key="sk-test")
+        delay = float(client.RETRY_DELAY_SECONDS)
+        for _ in range(50):
+            delay = client._next_delay(delay)
+            assert client.RETRY_DELAY_SECONDS <= delay <= client.MAX_RETRY_DELAY_SECONDS
+
+    def test_should_retry(self) -> None:
+        """Test that only rate limits and server errors are retryable."""
+        assert OpenRouterClient._should_retry(429)
+        assert OpenRouterClient._should_retry(500)
+        assert OpenRouterClient._should_retry(503)
+        assert not OpenRouterClient._should_retry(400)
+        assert not OpenRouterClient._should_retry(404)
+
+
+class TestRateLimiter:
+    """Tests for the per-key request limiter."""
+
+    async def test_waits_when_bucket_is_empty(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that requests beyond the budget wait for a token to refill."""
+        waits: list[float] = []
+
+        async def fake_sleep(seconds: float) -> None:
+            waits.append(seconds)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+        limiter = RateLimiter(requests_per_minute=60)
+        for _ in range(60):
+            await limiter.acquire()
+        assert waits == []
+
+        await limiter.acquire()
+        assert len(waits) == 1
+        assert 0.9 < waits[0] <= 1.0
+
+    def test_limiter_shared_per_key_without_plaintext(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that limiters are shared per key and not keyed by the raw key."""
+        monkeypatch.setattr(ai_client, "_rate_limiters", ai_client.TTLCache(maxsize=8, ttl=60))
+
+        with patch("community_scout.ai.client.get_settings") as mock_get_settings:
+            mock_get_settings.return_value.openrouter_requests_per_minute = 60
+            first = ai_client._get_rate_limiter("sk-one")
+            assert ai_client._get_rate_limiter("sk-one") is first
+            assert ai_client._get_rate_limiter("sk-two") is not first
+
+        assert "sk-one" not in ai_client._rate_limiters
+        assert len(ai_client._rate_limiters) == 2
+
+
+class TestSharedClient:
+    """Tests for the process-wide HTTP client."""
+
+    async def test_instances_share_http_client(self) -> None:
+        """Test that clients for different keys reuse one connection pool."""
+        first = OpenRouterClient(api_key="sk-one")
+        second = OpenRouterClient(api_key="sk-two")
+        try:
+            assert first.client is second.client
+            await first.aclose()
+            assert not second.client.is_closed
+        finally:
+            await close_shared_client()
+
+    async def test_auth_header_sent_per_request(self) -> None:
+        """Test that each client authenticates with its own key."""
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(200, json={"data": {}})
+
+        client = OpenRouterClient(api_key="sk-test")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            await client.verify_connection()
+        assert seen == ["Bearer sk-test"]
+
+
+class TestVerifyConnection:
+    """Tests for the connection check."""
+
+    @staticmethod
+    def _client_with(transport: httpx.MockTransport) -> OpenRouterClient:
+        client = OpenRouterClient(api_key="sk-test", base_url="https://openrouter.test/api/v1")
+        client._client = httpx.AsyncClient(transport=transport)
+        return client
+
+    async def test_verify_connection_ok(self) -> None:
+        """Test that a 200 from /auth/key counts as verified."""
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.path)
+            return httpx.Response(200, json={"data": {}})
+
+        async with self._client_with(httpx.MockTransport(handler)) as client:
+            assert await client.verify_connection() is True
+        assert seen == ["/api/v1/auth/key"]
+
+    async def test_verify_connection_unauthorized(self) -> None:
+        """Test that a 401 is reported as a failed check."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(401)
+
+        async with self._client_with(httpx.MockTransport(handler)) as client:
+            assert await client.verify_connection() is False
+
+
+class TestChatStreaming:
+    """Tests for streamed chat completions."""
+
+    async def test_chat_assembles_stream(self) -> None:
+        """Test that content deltas and final usage are combined."""
+        events = [
+            ": OPENROUTER PROCESSING",
+            'data: {"model": "test/model", "choices": [{"delta": {"role": "assistant"}}]}',
+            'data: {"model": "test/model", "choices": [{"delta": {"content": "Hello"}}]}',
+            'data: {"model": "test/model", "choices": [{"delta": {"content": ", world"}}]}',
+            'data: {"model": "test/model", "choices": [{"delta": {}}], '
+            '"usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5}}',
+            "data: [DONE]",
+        ]
+        payloads: list[bytes] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            payloads.append(request.content)
+            return httpx.Response(
+                200,
+                content="\n\n".join(events).encode(),
+                headers={"Content-Type": "text/event-stream"},
+            )
+
+        client = OpenRouterClient(api_key="sk-test")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            completion = await client.chat([ChatMessage(role="user", content="Hi")])
+
+        assert completion.content == "Hello, world"
+        assert completion.model == "test/model"
+        assert completion.total_tokens == 5
+        assert b'"stream":true' in payloads[0]
+
+    @pytest.mark.parametrize(
+        "event",
+        ['data: {"model": "m", "choi', 'data: {"error": "upstream overloaded"}'],
+    )
+    async def test_chat_stream_errors_raise_openrouter_error(self, event: str) -> None:
+        """Test that malformed events and string errors surface as OpenRouterError."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200,
+                content=f"{event}\n\n".encode(),
+                headers={"Content-Type": "text/event-stream"},
+            )
+
+        client = OpenRouterClient(api_key="sk-test")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            with pytest.raises(OpenRouterError):
+                await client.chat([ChatMessage(role="user", content="Hi")])
+
+    async def test_chat_does_not_retry_client_errors(self) -> None:
+        """Test that a 400 fails after a single request."""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(400, json={"error": {"message": "bad model"}})
+
+        client = OpenRouterClient(api_key="sk-test")
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            with pytest.raises(OpenRouterError, match="400"):
+                await client.chat([ChatMessage(role="user", content="Hi")])
+
+        assert calls == 1
+
+    async def test_chat_retries_server_errors(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that a 5xx response is retried."""
+        responses = [
+            httpx.Response(503),
+            httpx.Response(
+                200,
+                content=b'data: {"model": "m", "choices": [{"delta": {"content": "ok"}}]}\n\n',
+                headers={"Content-Type": "text/event-stream"},
+            ),
+        ]
+
+        async def no_sleep(seconds: float) -> None:
+            pass
+
+        monkeypatch.setattr(asyncio, "sleep", no_sleep)
+
+        client = OpenRouterClient(api_key="sk-test")
+        client._client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: responses.pop(0))
+        )
+        async with client:
+            completion = await client.chat([ChatMessage(role="user", content="Hi")])
+
+        assert completion.content == "ok"
+        assert responses == []
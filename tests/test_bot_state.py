@@ -0,0 +1,59 @@
+"""Tests for bot state storage."""
+
+import discord
+import pytest
+from discord import app_commands
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from community_scout.bot.bot import command_tree_hash
+from community_scout.bot.state import get_bot_state, set_bot_state
+
+
+class TestBotState:
+    """Tests for bot state get/set."""
+
+    @pytest.mark.asyncio
+    async def test_get_missing_key(self, db_session: AsyncSession) -> None:
+        """Test that an unset key returns None."""
+        assert await get_bot_state(db_session, "command_sync_hash:global") is None
+
+    @pytest.mark.asyncio
+    async def test_set_and_overwrite(self, db_session: AsyncSession) -> None:
+        """Test storing a value and replacing it."""
+        await set_bot_state(db_session, "command_sync_hash:global", "abc")
+        assert await get_bot_state(db_session, "command_sync_hash:global") == "abc"
+
+        await set_bot_state(db_session, "command_sync_hash:global", "def")
+        assert await get_bot_state(db_session, "command_sync_hash:global") == "def"
+
+
+class TestCommandTreeHash:
+    """Tests for the slash command sync hash."""
+
+    @staticmethod
+    def make_tree(description: str) -> app_commands.CommandTree[discord.Client]:
+        tree: app_commands.CommandTree[discord.Client] = app_commands.CommandTree(
+            discord.Client(intents=discord.Intents.none())
+        )
+
+        @tree.command(name="ping", description=description)
+        async def ping(interaction: discord.Interaction) -> None:
+            pass
+
+        @tree.command(name="echo", description="Echo a message")
+        async def echo(interaction: discord.Interaction, message: str) -> None:
+            pass
+
+        return tree
+
+    def test_hash_stable_for_same_commands(self) -> None:
+        """Test that identical trees hash the same."""
+        first = command_tree_hash(self.make_tree("Check the bot is alive"), None)
+        second = command_tree_hash(self.make_tree("Check the bot is alive"), None)
+        assert first == second
+
+    def test_hash_changes_with_command(self) -> None:
+        """Test that changing a command changes the hash."""
+        before = command_tree_hash(self.make_tree("Check the bot is alive"), None)
+        after = command_tree_hash(self.make_tree("Ping the bot"), None)
+        assert before != after
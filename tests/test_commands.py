@@ -0,0 +1,32 @@
+"""Tests for slash command database helpers."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from community_scout.bot.commands import set_user_active
+from community_scout.models import DiscordUser
+
+
+class TestSetUserActive:
+    """Tests for pausing and resuming notifications."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_user(self, db_session: AsyncSession) -> None:
+        """Test that an unknown Discord ID returns None."""
+        assert await set_user_active(db_session, "000", False) is None
+
+    @pytest.mark.asyncio
+    async def test_pause_and_resume(
+        self, db_session: AsyncSession, test_discord_user: DiscordUser
+    ) -> None:
+        """Test state transitions and repeated requests."""
+        discord_id = test_discord_user.discord_id
+
+        assert await set_user_active(db_session, discord_id, False) is True
+        assert await set_user_active(db_session, discord_id, False) is False
+
+        await db_session.refresh(test_discord_user)
+        assert test_discord_user.is_active is False
+
+        assert await set_user_active(db_session, discord_id, True) is True
+        assert await set_user_active(db_session, discord_id, True) is False
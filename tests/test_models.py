@@ -1,7 +1,5 @@
 """Tests for new data models."""
 
-from datetime import UTC, datetime
-
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -77,7 +75,7 @@ class TestHNItem:
             url="https://github.com/user/project",
             author="hackernews_user",
             score=142,
-            created_utc=datetime.now(UTC),
+            created_utc=1_700_000_000,
         )
         db_session.add(item)
         await db_session.commit()
@@ -99,7 +97,7 @@ class TestHNItem:
             author="commenter",
             score=50,
             parent_id=12345678,
-            created_utc=datetime.now(UTC),
+            created_utc=1_700_000_000,
         )
         db_session.add(item)
         await db_session.commit()
@@ -130,7 +128,7 @@ class TestUserAlert:
             title="Python 4.0 Released",
             author="python_news",
             score=500,
-            created_utc=datetime.now(UTC),
+            created_utc=1_700_000_000,
         )
         db_session.add(item)
         await db_session.commit()
@@ -1,7 +1,7 @@
 """Tests for alert notifier functionality."""
 
-from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +15,7 @@ from community_scout.models import (
     UserAlert,
     UserKeyword,
 )
+from community_scout.notifier import alert_notifier
 from community_scout.notifier.alert_notifier import AlertNotifier
 
 
@@ -37,7 +38,7 @@ class TestAlertNotifier:
             title="Test Story",
             author="testuser",
             score=100,
-            created_utc=datetime.now(UTC),
+            created_utc=1_700_000_000,
         )
         db_session.add(item)
         await db_session.commit()
@@ -77,7 +78,7 @@ class TestAlertNotifier:
             title="Test Story 2",
             author="testuser",
             score=50,
-            created_utc=datetime.now(UTC),
+            created_utc=1_700_000_000,
         )
         db_session.add(item)
         await db_session.commit()
@@ -113,6 +114,45 @@ class TestAlertNotifier:
         api_key = notifier.get_user_api_key(test_discord_user)
         assert api_key is None
 
+    @pytest.mark.asyncio
+    async def test_get_user_api_key_cached(self, db_session: AsyncSession) -> None:
+        """Test that a ciphertext is only decrypted once per notifier."""
+        user = MagicMock(id=1, openrouter_api_key="ciphertext")
+        notifier = AlertNotifier(db_session, MagicMock())
+
+        with patch(
+            "community_scout.notifier.alert_notifier.decrypt", return_value="sk-plain"
+        ) as decrypt:
+            assert notifier.get_user_api_key(user) == "sk-plain"
+            assert notifier.get_user_api_key(user) == "sk-plain"
+
+        decrypt.assert_called_once_with("ciphertext")
+
+    @pytest.mark.asyncio
+    async def test_excerpt_truncates_and_memoizes(self, db_session: AsyncSession) -> None:
+        """Test that long text is truncated once per item and length."""
+        notifier = AlertNotifier(db_session, MagicMock())
+        item = MagicMock(id=1, text="x" * 400)
+
+        excerpt = notifier._excerpt(item, 300)
+        assert excerpt == "x" * 300 + "..."
+        assert notifier._excerpt(item, 300) is excerpt
+        assert notifier._excerpt(item, 1000) == "x" * 400
+
+    @pytest.mark.asyncio
+    async def test_resolve_channel_fetches_once(self, db_session: AsyncSession) -> None:
+        """Test that a channel missing from the bot's state is fetched only once."""
+        channel = MagicMock()
+        bot = MagicMock()
+        bot.get_channel.return_value = None
+        bot.fetch_channel = AsyncMock(return_value=channel)
+        notifier = AlertNotifier(db_session, bot)
+
+        assert await notifier._resolve_channel(42) is channel
+        assert await notifier._resolve_channel(42) is channel
+
+        bot.fetch_channel.assert_awaited_once_with(42)
+
     @pytest.mark.asyncio
     async def test_build_alert_embed(
         self,
@@ -131,7 +171,7 @@ class TestAlertNotifier:
             url="https://example.com",
             author="developer",
             score=200,
-            created_utc=datetime.now(UTC),
+            created_utc=1_700_000_000,
         )
         db_session.add(item)
         await db_session.commit()
@@ -175,12 +215,12 @@ class TestAlertNotifier:
             title="Test",
             author="test",
             score=1,
-            created_utc=datetime.now(UTC),
+            created_utc=1_700_000_000,
         )
 
         # Patch settings to have no API key
-        with patch("community_scout.notifier.alert_notifier.settings") as mock_settings:
-            mock_settings.openrouter_api_key = ""
+        with patch("community_scout.notifier.alert_notifier.get_settings") as mock_get_settings:
+            mock_get_settings.return_value.openrouter_api_key = ""
             summary = await notifier.generate_summary(item, api_key=None)
 
         assert summary is None
@@ -211,6 +251,163 @@ class TestAlertNotifier:
 
         assert thread_id == "123456789"
 
+    @pytest.mark.asyncio
+    async def test_prefetch_source_threads(
+        self,
+        db_session: AsyncSession,
+        test_discord_user: DiscordUser,
+        test_keyword: UserKeyword,
+        test_content_source: ContentSource,
+    ) -> None:
+        """Test that prefetched threads are served without another query."""
+        db_session.add(
+            SourceThread(
+                user_id=test_discord_user.id,
+                source_id=test_content_source.id,
+                thread_id="987654321",
+            )
+        )
+        alert = UserAlert(
+            user_id=test_discord_user.id,
+            item_id=1,
+            keyword_id=test_keyword.id,
+            source_id=test_content_source.id,
+        )
+
+        notifier = AlertNotifier(db_session, MagicMock())
+        await notifier.prefetch_source_threads([alert])
+
+        with patch.object(db_session, "execute") as execute:
+            thread_id = await notifier.get_or_create_source_thread(
+                test_discord_user, test_content_source
+            )
+
+        assert thread_id == "987654321"
+        execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ai_clients_reused_per_key(self, db_session: AsyncSession) -> None:
+        """Test that one OpenRouter client is kept per API key until aclose."""
+        notifier = AlertNotifier(db_session, MagicMock())
+
+        first = notifier._get_ai_client("sk-one")
+        assert notifier._get_ai_client("sk-one") is first
+        assert notifier._get_ai_client("sk-two") is not first
+
+        await notifier.aclose()
+        assert notifier._get_ai_client("sk-one") is not first
+
+    @pytest.mark.asyncio
+    async def test_generate_summary_cached(
+        self,
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test identical prompts reuse the cached summary unless bypassed."""
+        monkeypatch.setattr(alert_notifier, "_summary_cache", {})
+        notifier = AlertNotifier(db_session, MagicMock())
+        client = notifier._get_ai_client("sk-test")
+        chat = AsyncMock(return_value=MagicMock(content=" A summary. "))
+        monkeypatch.setattr(client, "chat", chat)
+
+        item = HNItem(
+            hn_id=99998,
+            item_type="story",
+            title="Cached",
+            author="test",
+            score=1,
+            created_utc=1_700_000_000,
+        )
+
+        assert await notifier.generate_summary(item, api_key="sk-test") == "A summary."
+        assert await notifier.generate_summary(item, api_key="sk-test") == "A summary."
+        assert chat.await_count == 1
+
+        await notifier.generate_summary(item, api_key="sk-test", use_cache=False)
+        assert chat.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_process_pending_alerts_bulk_updates_sent(
+        self,
+        db_session: AsyncSession,
+        test_discord_user: DiscordUser,
+        test_keyword: UserKeyword,
+        test_content_source: ContentSource,
+    ) -> None:
+        """Test that queued sent alerts are written when the batch finishes."""
+        item = HNItem(
+            hn_id=12347,
+            item_type="story",
+            title="Bulk Story",
+            author="testuser",
+            created_utc=1_700_000_000,
+        )
+        db_session.add(item)
+        await db_session.flush()
+        alert = UserAlert(
+            user_id=test_discord_user.id,
+            item_id=item.id,
+            keyword_id=test_keyword.id,
+            source_id=test_content_source.id,
+            status=AlertStatus.PENDING.value,
+        )
+        db_session.add(alert)
+        await db_session.commit()
+
+        notifier = AlertNotifier(db_session, MagicMock())
+
+        async def fake_send(pending: UserAlert) -> bool:
+            notifier._sent_updates.append(
+                {
+                    "id": pending.id,
+                    "status": AlertStatus.SENT.value,
+                    "summary": "A summary",
+                    "discord_message_id": "555",
+                }
+            )
+            return True
+
+        with patch.object(notifier, "send_alert", side_effect=fake_send):
+            result = await notifier.process_pending_alerts()
+
+        assert result.alerts_sent == 1
+        await db_session.refresh(alert)
+        assert alert.status == AlertStatus.SENT.value
+        assert alert.discord_message_id == "555"
+        assert alert.summary == "A summary"
+
+    @pytest.mark.asyncio
+    async def test_process_pending_alerts_bounds_concurrency(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that alerts are sent concurrently up to the limit and tallied."""
+        alerts = [MagicMock(id=i, user_id=1, source_id=1) for i in range(6)]
+        in_flight = 0
+        peak = 0
+
+        async def fake_send(alert: MagicMock) -> bool:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if alert.id == 5:
+                raise RuntimeError("boom")
+            return bool(alert.id % 2 == 0)
+
+        notifier = AlertNotifier(db_session, MagicMock())
+        with (
+            patch.object(notifier, "get_pending_alerts", AsyncMock(return_value=alerts)),
+            patch.object(notifier, "prefetch_source_threads", AsyncMock()),
+            patch.object(notifier, "send_alert", side_effect=fake_send),
+        ):
+            result = await notifier.process_pending_alerts(concurrency=2)
+
+        assert peak == 2
+        assert result.alerts_processed == 6
+        assert result.alerts_sent == 3
+        assert result.alerts_failed == 3
+
 
 class TestNotifyResult:
     """Tests for NotifyResult dataclass."""
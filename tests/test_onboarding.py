@@ -0,0 +1,42 @@
+"""Tests for member onboarding helpers."""
+
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from community_scout.bot import onboarding
+from community_scout.bot.onboarding import get_or_create_source_id
+from community_scout.models import ContentSource
+
+
+@pytest.fixture(autouse=True)
+def clear_source_id_cache() -> Generator[None, None, None]:
+    """Start every test with an empty source ID cache."""
+    onboarding._source_id_cache.clear()
+    yield
+    onboarding._source_id_cache.clear()
+
+
+class TestGetOrCreateSourceId:
+    """Tests for content source ID lookup."""
+
+    @pytest.mark.asyncio
+    async def test_creates_missing_source(self, db_session: AsyncSession) -> None:
+        """Test that a missing source is inserted but not cached."""
+        source_id = await get_or_create_source_id(db_session, "hackernews")
+
+        source = await db_session.get(ContentSource, source_id)
+        assert source is not None
+        assert source.name == "hackernews"
+        assert "hackernews" not in onboarding._source_id_cache
+
+    @pytest.mark.asyncio
+    async def test_existing_source_is_cached(
+        self, db_session: AsyncSession, test_content_source: ContentSource
+    ) -> None:
+        """Test that an existing source ID is returned and cached."""
+        source_id = await get_or_create_source_id(db_session, "hackernews")
+
+        assert source_id == test_content_source.id
+        assert onboarding._source_id_cache["hackernews"] == test_content_source.id
@@ -1,8 +1,10 @@
 """Tests for HN scanner functionality."""
 
-from datetime import UTC, datetime
+import asyncio
+from collections.abc import AsyncIterator, Generator
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -14,11 +16,22 @@ from community_scout.models import (
     HNItem,
     UserKeyword,
 )
-from community_scout.scanner import match_keywords
+from community_scout.scanner import hn_scanner, match_keywords
+from community_scout.scanner import run as scanner_run
 from community_scout.scanner.hn_scanner import HNScanner, get_searchable_text
+from community_scout.scanner.run import ScannerRunner
 from community_scout.scanner.state import get_scanner_state, update_scanner_state
 
 
+@pytest.fixture(autouse=True)
+def clear_scanner_caches(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Start every test without process-wide scanner caches."""
+    monkeypatch.setattr(hn_scanner, "_content_source_cache", None)
+    monkeypatch.setattr(hn_scanner, "_keyword_cache", None)
+    monkeypatch.setattr(hn_scanner, "_matcher_cache", None)
+    yield
+
+
 class TestMatchKeywords:
     """Tests for keyword matching function."""
 
@@ -90,6 +103,13 @@ class TestMatchKeywords:
         matches = match_keywords(text, keywords)
         assert set(matches) == {"c++ project", "c# basics"}
 
+    def test_overlapping_keywords(self) -> None:
+        """Test that keywords sharing a start position all match."""
+        text = "Node.js makes machine learning models easy"
+        keywords = ["node", "node.js", "machine learning", "learning models", "machine"]
+        matches = match_keywords(text, keywords)
+        assert matches == keywords
+
 
 class TestGetSearchableText:
     """Tests for searchable text extraction."""
@@ -105,7 +125,7 @@ class TestGetSearchableText:
             author="user",
             score=42,
             parent_id=None,
-            created_at=datetime.now(UTC),
+            created_utc=1_700_000_000,
         )
         text = get_searchable_text(item)
         assert "Show HN: My Project" in text
@@ -123,7 +143,7 @@ class TestGetSearchableText:
             author="user",
             score=10,
             parent_id=123,
-            created_at=datetime.now(UTC),
+            created_utc=1_700_000_000,
         )
         text = get_searchable_text(item)
         assert text == "This is a comment"
@@ -207,6 +227,31 @@ class TestHNScanner:
         assert "rust" in keyword_map
         assert "java" not in keyword_map  # inactive
 
+    @pytest.mark.asyncio
+    async def test_get_active_keywords_cached_until_changed(
+        self,
+        db_session: AsyncSession,
+        test_discord_user: DiscordUser,
+    ) -> None:
+        """Test that the keyword map is reused until active keywords change."""
+        kw = UserKeyword(user_id=test_discord_user.id, phrase="python")
+        db_session.add(kw)
+        await db_session.commit()
+
+        mock_client = MagicMock(spec=HNClient)
+        first = await HNScanner(db_session, mock_client).get_active_keywords()
+        matcher = hn_scanner._matcher_cache
+        assert matcher is not None and matcher[0] is first
+        assert await HNScanner(db_session, mock_client).get_active_keywords() is first
+        assert hn_scanner._matcher_cache is matcher
+
+        kw.is_active = False
+        db_session.add(UserKeyword(user_id=test_discord_user.id, phrase="rust"))
+        await db_session.commit()
+
+        keyword_map = await HNScanner(db_session, mock_client).get_active_keywords()
+        assert list(keyword_map) == ["rust"]
+
     @pytest.mark.asyncio
     async def test_store_item(self, db_session: AsyncSession) -> None:
         """Test storing an HN item."""
@@ -222,7 +267,7 @@ class TestHNScanner:
             author="testuser",
             score=100,
             parent_id=None,
-            created_at=datetime.now(UTC),
+            created_utc=1_700_000_000,
         )
 
         hn_item = await scanner.store_item(item_data)
@@ -233,6 +278,43 @@ class TestHNScanner:
         hn_item2 = await scanner.store_item(item_data)
         assert hn_item2.id == hn_item.id
 
+    @pytest.mark.asyncio
+    async def test_process_batch_stores_only_matches(
+        self,
+        db_session: AsyncSession,
+        test_keyword: UserKeyword,
+    ) -> None:
+        """Test that a batch stores matching items once and alerts per match."""
+        mock_client = MagicMock(spec=HNClient)
+        scanner = HNScanner(db_session, mock_client)
+        source = await scanner.get_content_source()
+        keyword_map = await scanner.get_active_keywords()
+
+        def make_item(hn_id: int, title: str) -> HNItemData:
+            return HNItemData(
+                id=hn_id,
+                item_type="story",
+                title=title,
+                text=None,
+                url=None,
+                author="testuser",
+                score=1,
+                parent_id=None,
+                created_utc=1_700_000_000,
+            )
+
+        items = [
+            make_item(1, f"All about {test_keyword.phrase}"),
+            make_item(2, "Nothing relevant here"),
+        ]
+
+        stored, alerts = await scanner.process_batch(items, keyword_map, source)
+        assert (stored, alerts) == (1, 1)
+
+        # Re-processing the same batch must not duplicate items or alerts
+        stored, alerts = await scanner.process_batch(items, keyword_map, source)
+        assert (stored, alerts) == (1, 0)
+
     @pytest.mark.asyncio
     async def test_create_alert(
         self,
@@ -252,7 +334,7 @@ class TestHNScanner:
             title="Python News",
             author="news",
             score=50,
-            created_utc=datetime.now(UTC),
+            created_utc=1_700_000_000,
         )
         db_session.add(hn_item)
         await db_session.commit()
@@ -351,3 +433,90 @@ class TestHNItemData:
         }
         item = HNItemData.from_api_response(data)
         assert item is None
+
+
+class TestHNClientBatch:
+    """Tests for concurrent item fetching."""
+
+    @pytest.mark.asyncio
+    async def test_get_items_batch_keeps_order_and_skips_failures(self) -> None:
+        """Test that results follow input order and failed/missing items are dropped."""
+
+        async def fake_get_item(item_id: int) -> HNItemData | None:
+            if item_id == 3:
+                raise RuntimeError("boom")
+            if item_id == 4:
+                return None
+            return HNItemData(
+                id=item_id,
+                item_type="story",
+                title=None,
+                text=None,
+                url=None,
+                author="a",
+                score=0,
+                parent_id=None,
+                created_utc=1_700_000_000,
+            )
+
+        client = HNClient()
+        client.get_item = AsyncMock(side_effect=fake_get_item)  # type: ignore[method-assign]
+
+        items = await client.get_items_batch([5, 1, 3, 4, 2], concurrency=2)
+
+        assert [item.id for item in items] == [5, 1, 2]
+        assert client.get_item.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_stream_updates_yields_item_ids(self) -> None:
+        """Test that put/patch events of the updates stream yield item IDs."""
+        events = [
+            "event: put",
+            'data: {"path": "/", "data": {"items": [10, 11], "profiles": ["pg"]}}',
+            "",
+            "event: keep-alive",
+            "data: null",
+            "",
+            "event: patch",
+            'data: {"path": "/items", "data": {"0": 12, "1": 13}}',
+            "",
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/v0/updates.json"
+            return httpx.Response(200, content="\n".join(events).encode())
+
+        client = HNClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        updates = [item_ids async for item_ids in client.stream_updates()]
+        await client._client.aclose()
+
+        assert updates == [[10, 11], [12, 13]]
+
+
+class TestScannerRunner:
+    """Tests for the scanner runner's update stream watcher."""
+
+    @pytest.mark.asyncio
+    async def test_watch_updates_survives_bad_payload(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an unexpected stream error reconnects instead of ending the watcher."""
+        runner = ScannerRunner(stream_updates=True)
+        calls = 0
+
+        async def fake_stream(self: HNClient) -> AsyncIterator[list[int]]:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ValueError("malformed payload")
+            yield [1]
+            runner.request_shutdown()
+
+        monkeypatch.setattr(HNClient, "stream_updates", fake_stream)
+        monkeypatch.setattr(scanner_run, "STREAM_RECONNECT_SECONDS", 0)
+
+        await asyncio.wait_for(runner.watch_updates(), timeout=5)
+
+        assert calls == 2
+        assert runner._new_items.is_set()
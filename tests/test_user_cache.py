@@ -0,0 +1,50 @@
+"""Tests for the Discord user cache."""
+
+from collections.abc import Generator
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from community_scout.bot import user_cache
+from community_scout.bot.user_cache import get_user_fields, invalidate_user
+from community_scout.models import DiscordUser
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache(use_test_engine: None) -> Generator[None, None, None]:
+    """Start every test with an empty cache, reading from the test database."""
+    user_cache._user_cache.clear()
+    yield
+    user_cache._user_cache.clear()
+
+
+class TestUserCache:
+    """Tests for cached user lookups."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_not_cached(self, db_session: AsyncSession) -> None:
+        """Test that a missing user returns None and is not cached."""
+        assert await get_user_fields("000") is None
+        assert "000" not in user_cache._user_cache
+
+    @pytest.mark.asyncio
+    async def test_lookup_is_cached_until_invalidated(
+        self, db_session: AsyncSession, test_discord_user: DiscordUser
+    ) -> None:
+        """Test that a cached entry survives row changes until invalidated."""
+        discord_id = test_discord_user.discord_id
+
+        cached = await get_user_fields(discord_id)
+        assert cached is not None
+        assert cached.id == test_discord_user.id
+        assert cached.channel_id == test_discord_user.channel_id
+        assert cached.is_active is True
+
+        test_discord_user.is_active = False
+        await db_session.commit()
+        assert await get_user_fields(discord_id) == cached
+
+        invalidate_user(discord_id)
+        refreshed = await get_user_fields(discord_id)
+        assert refreshed is not None
+        assert refreshed.is_active is False